@@ -3,59 +3,216 @@ import subprocess
 import importlib.util
 import os
 import time
+STARTUP_T0 = time.perf_counter()  # Açılış süresi ölçümünün başlangıcı
+import json
+import site
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+
+startup_marks = []
+startup_splash = None  # Ana betik çalışırken açılış penceresi; aşamalar ona da bildirilir
+
+def mark_startup(stage):
+    """Açılış aşamasının süresini kaydeder; önceki aşamadan ve süreç başından geçen süreyi yazdırır"""
+    elapsed = time.perf_counter() - STARTUP_T0
+    previous = startup_marks[-1][1] if startup_marks else 0.0
+    startup_marks.append((stage, elapsed))
+    print(f"Açılış: {stage:<18} +{(elapsed - previous) * 1000:7.1f} ms (toplam {elapsed:.2f} s)")
+    if startup_splash is not None:
+        # Aşamalar arka plan iş parçacıklarından da gelebilir; sinyal GUI iş parçacığına taşır
+        startup_splash.signals.stage_reached.emit(stage)
+
+# Üçüncü taraf paketlerin içe aktarma adları
+REQUIRED_PACKAGES = ['PySide6', 'requests', 'cv2', 'tensorflow', 'numpy',
+                     'psutil', 'urllib3']
+# İçe aktarma adı PyPI dağıtım adından farklı olan paketler
+DISTRIBUTION_NAMES = {'cv2': 'opencv-python'}
+# Gereksinimi aynı şekilde karşılayan hafif paketler; biri kuruluysa asıl paket yüklenmez
+ALTERNATIVE_PACKAGES = {'tensorflow': ('tflite_runtime',)}
+REQUIREMENTS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements_cache.json")
+# Varsa paketler yalnızca bu yerel tekerlek deposundan yüklenir (internetsiz saha makineleri)
+WHEELHOUSE_DIR = os.environ.get("SAR_WHEELHOUSE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "wheelhouse")
+# Tekerlek deposu yetmezse PyPI denensin mi; internetsiz makinede her açılışta ağ zaman aşımı beklenmesin
+PYPI_FALLBACK = os.environ.get("SAR_PYPI_FALLBACK") == "1"
+
+def environment_fingerprint(required):
+    """Yorumlayıcı yolu ve site-packages dizinlerinin değişiklik zamanlarından ortam parmak izi üretir"""
+    paths = set(site.getsitepackages()) | {site.getusersitepackages()}
+    paths |= {sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"]}
+    # pip bir paket kurup kaldırdığında site-packages dizininin mtime değeri değişir
+    mtimes = [[path, os.stat(path).st_mtime_ns] for path in sorted(paths) if os.path.isdir(path)]
+    return {"executable": sys.executable, "version": sys.version,
+            "site_packages": mtimes, "required": list(required)}
+
+def requirements_cached(required):
+    """Aynı ortam daha önce denetlendiyse True döndürür"""
+    try:
+        with open(REQUIREMENTS_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f) == environment_fingerprint(required)
+    except (OSError, ValueError):
+        return False
+
+def save_requirements_cache(required):
+    try:
+        with open(REQUIREMENTS_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(environment_fingerprint(required), f)
+    except OSError as e:
+        print(f"Gereksinim önbelleği yazılamadı: {e}")
+
+def probe_requirements(required):
+    """Tüm paketleri (ve yerine geçen alternatiflerini) paralel denetler, eksik olanları listede verilen sırayla döndürür"""
+    candidates = [(pkg,) + ALTERNATIVE_PACKAGES.get(pkg, ()) for pkg in required]
+    names = [name for names in candidates for name in names]
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        found = dict(zip(names, pool.map(importlib.util.find_spec, names)))
+    return [names[0] for names in candidates if all(found[name] is None for name in names)]
+
+def pip_install_command(distributions, offline):
+    command = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check']
+    if offline:
+        command += ['--no-index', '--find-links', WHEELHOUSE_DIR]
+    return command + list(distributions)
+
+def pip_install(packages, report):
+    """
+    Eksik paketleri tek pip çağrısıyla (tek bağımlılık çözümüyle) yükler.
+    Tekerlek deposu varsa yalnızca ondan yüklenir; depo yetersizse PyPI yalnızca
+    SAR_PYPI_FALLBACK=1 ile denenir. Depo yoksa doğrudan PyPI kullanılır.
+    pip çıktısı satır satır report(mesaj, ilerleme) ile iletilir; ilerleme bilinmiyorsa None'dır.
+    """
+    distributions = [DISTRIBUTION_NAMES.get(pkg, pkg) for pkg in packages]
+    if os.path.isdir(WHEELHOUSE_DIR):
+        if run_pip_install(pip_install_command(distributions, offline=True), len(distributions), report):
+            return True
+        if not PYPI_FALLBACK:
+            report("Tekerlek deposu yetersiz", None)
+            return False
+        report("Tekerlek deposu yetersiz, PyPI deneniyor", None)
+    return run_pip_install(pip_install_command(distributions, offline=False), len(distributions), report)
+
+def run_pip_install(command, count, report):
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+    except OSError as e:
+        report(f"pip çalıştırılamadı: {e}", None)
+        return False
+    collected = 0
+    for line in process.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        progress = None
+        if line.startswith(("Collecting", "Processing")):
+            # Bağımlılıklar da toplanır; toplama aşaması çubuğun yarısını geçmez
+            collected += 1
+            progress = min(50, collected * 50 / count)
+        elif line.startswith("Installing collected packages"):
+            progress = 75
+        elif line.startswith("Successfully installed"):
+            progress = 100
+        report(line, progress)
+    return process.wait() == 0
 
 def check_requirements_cli():
     """
     Komut satırında gereksinimleri kontrol eder ve eksik olanları yükler.
     QApplication sorunlarından kaçınmak için GUI kullanmayan versiyon.
     """
-    required = ['PySide6', 'requests', 'opencv-python', 'tensorflow', 'numpy',
-               'psutil', 'ctypes', 'pathlib', 'datetime', 'urllib3']
+    required = REQUIRED_PACKAGES
+    if requirements_cached(required):
+        return
     
     print("=== Gereksinimler denetleniyor ===")
+    missing = probe_requirements(required)
     
-    for pkg in required:
-        print(f"Denetleniyor: {pkg}...", end=" ")
-        sys.stdout.flush()
-        
-        if importlib.util.find_spec(pkg) is None:
-            print("Yükleniyor...")
-            try:
-                subprocess.check_call(
-                    [sys.executable, '-m', 'pip', 'install', pkg],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT
-                )
-                print(f"{pkg} başarıyla yüklendi.")
-            except Exception as e:
-                print(f"HATA: {pkg} yüklenirken bir sorun oluştu!")
-        else:
-            print("Zaten yüklü.")
+    if missing:
+        print(f"Yükleniyor: {', '.join(missing)}")
+        if not pip_install(missing, lambda message, progress: print(message)):
+            print("HATA: Paketler yüklenirken bir sorun oluştu!")
+            return
     
+    save_requirements_cache(required)
     print("=== Tüm gereksinimler denetlendi! ===")
 
-def create_gui_script():
+def check_requirements():
     """
-    Ayrı bir Python betiği oluşturur ve çalıştırır.
-    Bu, QApplication sorunlarını tamamen önler.
+    Gereksinimleri kontrol eder; PySide6 eksikse Qt açılmadan önce komut satırından yükler.
+    Açılış penceresinde yüklenecek diğer eksik paketleri döndürür.
     """
-    script_content = """
-import sys
-import time
+    required = REQUIRED_PACKAGES
+    # Ortam son denetimden beri değişmediyse hiçbir şey yapma
+    if requirements_cached(required):
+        return []
+    missing = probe_requirements(required)
+    if 'PySide6' in missing:
+        # Açılış penceresi için Qt yok: tüm eksikler tek seferde komut satırından yüklenir
+        print(f"Yükleniyor: {', '.join(missing)}")
+        if not pip_install(missing, lambda message, progress: print(message)):
+            print("HATA: Paketler yüklenirken bir sorun oluştu!")
+            return []
+        missing = []
+    if not missing:
+        # Kurulumdan sonraki ortam kaydedilir; sonraki açılışlar denetimi atlar
+        save_requirements_cache(required)
+    return missing
+
+# --provision: bağlantılı makinede tekerlek deposunu ve model önbelleğini hazırlar, arayüzü açmaz
+PROVISION_MODE = __name__ == "__main__" and "--provision" in sys.argv
+
+# Gereksinim kontrolü yapan fonksiyonu çağır
+if __name__ == "__main__":
+    missing_packages = check_requirements()
+    if PROVISION_MODE and missing_packages:
+        # Açılış penceresi açılmaz; eksikler numpy/requests içe aktarılmadan önce burada yüklenir
+        print(f"Yükleniyor: {', '.join(missing_packages)}")
+        if pip_install(missing_packages, lambda message, progress: print(message)):
+            save_requirements_cache(REQUIRED_PACKAGES)
+        else:
+            print("HATA: Paketler yüklenirken bir sorun oluştu!")
+            sys.exit(1)
+        missing_packages = []
+    mark_startup("gereksinimler")
+
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, 
+                              QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton)
+from PySide6.QtCore import (Qt, QTimer, QPropertyAnimation, QRect, QSize, 
+                           QEasingCurve, QPoint, Slot, QThread, Signal, QObject, QEvent,
+                           Property, QEventLoop, QDirIterator)
+from PySide6.QtGui import (QColor, QPainter, QPen, QBrush, QFont, 
+                          QFontMetrics, QGradient, QLinearGradient, QRadialGradient, 
+                          QPainterPath, QPixmap, QIcon, QImage, QRegion)
+from PySide6.QtGui import QTransform
 import threading
-from PySide6.QtCore import Qt, QTimer, Property, QPropertyAnimation, QEasingCurve, Signal, QObject
-from PySide6.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QFont
+
+# Açılış aşaması -> (ilerleme yüzdesi, açılış penceresinde gösterilecek mesaj)
+STARTUP_STAGES = {
+    "gereksinimler": (10, "Gereksinimler hazır"),
+    "kaynaklar": (20, "Kaynaklar yüklendi"),
+    "modüller": (30, "Modüller yüklendi"),
+    "hava durumu": (45, "Hava durumu alındı"),
+    "ana pencere": (55, "Arayüz oluşturuldu"),
+    "ilk çizim": (65, "Arayüz çizildi"),
+    "OpenCV": (75, "Görüntü kütüphanesi yüklendi"),
+    "kamera yoklaması": (85, "Kamera denetlendi"),
+    "poz modeli": (95, "Poz modeli yüklendi"),
+    "kamera karosu": (100, "Kamera hazır"),
+}
+# Bu aşamaların hepsi tamamlanınca açılış penceresi kapanır
+STARTUP_FINAL_STAGES = {"ilk çizim", "kamera karosu"}
+STARTUP_SPLASH_TIMEOUT_MS = 15000
 
 class InstallationSignals(QObject):
     update_output = Signal(str)
     update_progress = Signal(float)
+    stage_reached = Signal(str)
     finished = Signal()
 
 class DynamicIslandWindow(QMainWindow):
-    def __init__(self, packages):
+    """Ana pencereyle aynı QApplication'da çalışan açılış penceresi"""
+    def __init__(self):
         super().__init__()
-        self.packages = packages
         
         # Pencere özelliklerini ayarla
         self.setWindowTitle("Yükleniyor...")
@@ -72,7 +229,9 @@ class DynamicIslandWindow(QMainWindow):
         self.signals = InstallationSignals()
         self.signals.update_output.connect(self.update_message)
         self.signals.update_progress.connect(self.update_progress)
-        self.signals.finished.connect(self.close)
+        self.signals.stage_reached.connect(self.on_stage_reached)
+        self.completed_stages = set()
+        self.progress_value = 0
         
         # Dynamic Island container
         self.island_widget = IslandWidget()
@@ -83,9 +242,13 @@ class DynamicIslandWindow(QMainWindow):
         
         # Ekranın ortasına konumlandır
         self.center_on_screen()
-        
-        # Denetleme işlemini başlat
-        QTimer.singleShot(100, self.start_checking)
+    
+    def start_timeout(self):
+        """
+        Bir aşama takılırsa açılış penceresi ana pencerenin önünde kalmasın.
+        Paket kurulumu bittikten sonra çağrılır; uzun bir pip çalışması pencereyi kapatmamalı.
+        """
+        QTimer.singleShot(STARTUP_SPLASH_TIMEOUT_MS, self.close)
     
     def center_on_screen(self):
         screen_geometry = QApplication.primaryScreen().geometry()
@@ -99,45 +262,50 @@ class DynamicIslandWindow(QMainWindow):
     def update_progress(self, value):
         self.island_widget.set_progress(value)
     
-    def start_checking(self):
-        self.thread = threading.Thread(target=self.process_requirements, daemon=True)
+    @Slot(str)
+    def on_stage_reached(self, stage):
+        if stage not in STARTUP_STAGES:
+            return
+        progress, message = STARTUP_STAGES[stage]
+        # Arka plan aşamaları sırasız gelebilir; çubuk geri gitmesin
+        self.progress_value = max(self.progress_value, progress)
+        self.update_message(message)
+        self.update_progress(self.progress_value)
+        # İçe aktarma ve pencere kurulumu olay döngüsünü bloklar; mesaj hemen çizilsin
+        self.island_widget.repaint()
+        self.completed_stages.add(stage)
+        if STARTUP_FINAL_STAGES <= self.completed_stages:
+            self.close()
+    
+    def install_packages(self, packages):
+        """Eksik paketleri arka planda yükler; bitene kadar olay döngüsünü çalıştırır, başarıyı döndürür"""
+        loop = QEventLoop()
+        self.signals.finished.connect(loop.quit)
+        self.install_ok = False
+        self.thread = threading.Thread(target=self.process_requirements, args=(packages,), daemon=True)
         self.thread.start()
+        loop.exec()
+        self.signals.finished.disconnect(loop.quit)
+        return self.install_ok
     
-    def process_requirements(self):
-        import importlib.util
-        import subprocess
-        import sys
-        import time
+    def process_requirements(self, packages):
+        self.signals.update_progress.emit(0)
+        self.signals.update_output.emit(f"Yükleniyor: {', '.join(packages)}")
         
-        for i, pkg in enumerate(self.packages):
-            progress = (i / len(self.packages)) * 100
-            self.signals.update_progress.emit(progress)
-            self.signals.update_output.emit(f"Denetleniyor: {pkg}")
-            
-            # Biraz beklet UI'nin güncellenmesi için
-            time.sleep(0.3)
-            
-            if importlib.util.find_spec(pkg) is None:
-                self.signals.update_output.emit(f"{pkg} yükleniyor...")
-                try:
-                    # Yükleme işlemi
-                    subprocess.check_call(
-                        [sys.executable, '-m', 'pip', 'install', pkg],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT
-                    )
-                    self.signals.update_output.emit(f"{pkg} başarıyla yüklendi")
-                except Exception as e:
-                    self.signals.update_output.emit(f"Hata: {pkg} yüklenirken bir sorun oluştu")
-            else:
-                self.signals.update_output.emit(f"{pkg} zaten yüklü")
-            
-            time.sleep(0.5)
+        def report(message, progress):
+            # pip satırları uzun olabilir; ada sığacak kadarı gösterilir
+            self.signals.update_output.emit(message if len(message) <= 40 else message[:39] + "…")
+            if progress is not None:
+                self.signals.update_progress.emit(progress)
+        
+        self.install_ok = pip_install(packages, report)
         
         # İşlem tamamlandı
         self.signals.update_progress.emit(100)
-        self.signals.update_output.emit("Tüm gereksinimler denetlendi!")
-        time.sleep(1)
+        if self.install_ok:
+            self.signals.update_output.emit("Tüm gereksinimler denetlendi!")
+        else:
+            self.signals.update_output.emit("Hata: Paketler yüklenirken bir sorun oluştu")
         self.signals.finished.emit()
 
 class IslandWidget(QWidget):
@@ -202,93 +370,593 @@ class IslandWidget(QWidget):
         
         # İlerleme çubuğu çiz
         if self._progress > 0:
-            progress_width = rect.width() * (self._progress / 100)
+            progress_width = int(rect.width() * (self._progress / 100))
             progress_rect = rect
             progress_rect.setWidth(progress_width)
             progress_path = QPainterPath()
             progress_path.addRoundedRect(progress_rect, 25, 25)
             painter.fillPath(progress_path, QColor(75, 75, 75))  # Biraz daha açık gri
 
-if __name__ == "__main__":
-    # Tüm paketleri burada listele
-    packages = [
-        'PySide6', 'requests', 'opencv-python', 'tensorflow', 'numpy', 
-        'pathlib', 'datetime', 'psutil', 'ctypes', 'urllib3', 'math',
-        'random', 'json'
-    ]
-    
+if __name__ == "__main__" and not PROVISION_MODE:
+    # Tek QApplication: açılış penceresi ağır içe aktarmalar ve ana pencere kurulurken görünür
     app = QApplication(sys.argv)
-    window = DynamicIslandWindow(packages)
-    window.show()
-    app.exec()
-    
-    # QApplication tamamen sonlandığında exit koduyla çık
-    sys.exit(0)
-"""
-    
-    # Geçici betiği oluştur
-    temp_script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_requirements_checker.py")
-    
-    with open(temp_script_path, "w", encoding="utf-8") as f:
-        f.write(script_content)
-    
-    # Betiği çalıştır ve tamamlanmasını bekle
-    subprocess.call([sys.executable, temp_script_path])
-    
-    # Geçici betiği sil
+    startup_splash = DynamicIslandWindow()
+    startup_splash.show()
+    app.processEvents()
+    if missing_packages and startup_splash.install_packages(missing_packages):
+        save_requirements_cache(REQUIRED_PACKAGES)
+    startup_splash.start_timeout()
+
+import random
+import math
+import heapq
+import itertools
+from pathlib import Path
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from datetime import datetime
+import resources_rc
+mark_startup("kaynaklar")
+# numpy arka plan parçacıkları için ilk karede gerekli, bu yüzden ertelenmez
+import numpy as np
+import queue
+import urllib.request
+import hashlib
+import shutil
+import mmap
+import asyncio
+import socket
+import selectors
+import abc
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: seri port kaynağı kullanılamaz
+    termios = None
+
+mark_startup("modüller")
+
+cv2 = None  # OpenCV ilk kamera yoklamasında arka planda yüklenir
+
+def load_vision_stack():
+    """OpenCV'yi ilk ihtiyaçta içe aktarır; pencerenin açılışını geciktirmesin diye GUI dışında çağrılır"""
+    global cv2
+    if cv2 is None:
+        import cv2 as module
+        cv2 = module
+        mark_startup("OpenCV")
+    return cv2
+
+CONFIG_PATH = Path(__file__).parent / "sar_config.json"
+DEFAULT_CONFIG = {
+    "pose_model": "auto",  # "auto" ya da POSE_MODELS içindeki bir model adı
+    "pose_fallback_order": ["thunder", "thunder_int8", "lightning", "lightning_int8"],
+    "pose_latency_budget_ms": 50,
+    "pose_num_threads": "auto",  # "auto" ya da yorumlayıcı iş parçacığı sayısı
+    "pose_delegate": "auto",  # "auto", "xnnpack" ya da "none"
+    "pose_cpu_affinity": None,  # Çıkarım iş parçacığının bağlanacağı çekirdekler, ör. [2, 3, 4, 5]
+    # ESP32-CAM listesi; url /stream (MJPEG) ya da /capture olabilir
+    "esp32_cameras": [
+        {"key": "heat_sensor", "title": "HEAT SENSOR", "url": "http://<ESP32-CAM-IP>/stream"},
+    ],
+    "camera_fetch_concurrency": 4,  # Tüm kameralar için aynı anda yapılan en fazla istek
+    "camera_bandwidth_limit_kbps": 0,  # Toplam bant genişliği sınırı, 0 = sınırsız
+    "camera_poll_interval_ms": 100,  # /capture modunda görünen kameralar için
+    "camera_idle_interval_ms": 5000,  # Başka sayfadaki kameralar yalnızca bu aralıkla yoklanır
+    "http_max_concurrency": 8,  # Ortak HTTP servisinde aynı anda sürebilecek istek sayısı
+    "http_connections_per_host": 4,
+    "http_timeout_s": 5,
+    # Sensör kaynakları: "simulated", "udp" (host, port), "tcp" (host, port) ya da "serial" (path, baudrate).
+    # Her satır/datagram {"status": "connected", "signal": 3} biçiminde JSON ya da "connected 3" metnidir.
+    "sensor_sources": [
+        {"key": "ai_system", "type": "simulated"},
+        {"key": "sonar", "type": "simulated"},
+        {"key": "surveillance", "type": "simulated"},
+        {"key": "tag_scanner", "type": "simulated"},
+    ],
+    "sensor_stale_after_s": 5,  # Bu süre veri göndermeyen gerçek kaynak bağlantısız sayılır
+    "grid_columns": 3,
+    "grid_rows": 2,
+    "particle_count": 200,  # Arka plandaki parçacık sayısı
+    "frame_interval_ms": 16,  # Ortak animasyon saatinin periyodu
+    "model_cache_dir": "model_cache",  # İçerik özetiyle adlandırılmış model dosyaları
+    "model_download_allowed": False,  # Önbellekte olmayan model internetten indirilebilir mi
+    "model_sha256": {},  # Model adı -> güvenilir sha256 özeti; POSE_MODELS içindekini geçersiz kılar
+    "weather_city": "Istanbul",
+    "weather_url": "https://wttr.in/{city}?format=j1",  # Testlerde yerel bir sunucu verilebilir
+    "weather_refresh_interval_s": 300,  # Bundan eski önbellek verisi açılışta hemen yenilenir
+    "weather_cache_max_age_s": 10800,  # Bundan eski önbellek verisi hiç gösterilmez
+}
+
+def load_config():
+    """Varsayılan ayarları sar_config.json içindekilerle birleştirir"""
+    config = dict(DEFAULT_CONFIG)
     try:
-        os.remove(temp_script_path)
-    except:
+        with open(CONFIG_PATH, encoding="utf-8") as f:
+            config.update(json.load(f))
+    except FileNotFoundError:
         pass
+    except Exception as e:
+        print(f"Ayar dosyası okunamadı: {e}")
+    return config
 
-def check_requirements():
+CONFIG = load_config()
+
+# Hesaplama maliyetine göre sıralı MoveNet modelleri. "sha256" yayımlanan dosyanın sabitlenmiş özetidir;
+# None ise model ilk indirildiğinde/önbelleğe alındığında görülen özet manifestte sabitlenir ve
+# sonraki her yüklemede o özet beklenir. sar_config.json içindeki model_sha256 bu değeri geçersiz kılar.
+POSE_MODELS = {
+    "thunder": {
+        "file": "movenet_thunder.tflite",
+        "sha256": None,
+        "url": "https://tfhub.dev/google/lite-model/movenet/singlepose/thunder/tflite/4?lite-format=tflite",
+    },
+    "thunder_int8": {
+        "file": "movenet_thunder_int8.tflite",
+        "sha256": None,
+        "url": "https://tfhub.dev/google/lite-model/movenet/singlepose/thunder/tflite/int8/4?lite-format=tflite",
+    },
+    "lightning": {
+        "file": "movenet_lightning.tflite",
+        "sha256": None,
+        "url": "https://tfhub.dev/google/lite-model/movenet/singlepose/lightning/tflite/float16/4?lite-format=tflite",
+    },
+    "lightning_int8": {
+        "file": "movenet_lightning_int8.tflite",
+        "sha256": None,
+        "url": "https://tfhub.dev/google/lite-model/movenet/singlepose/lightning/tflite/int8/4?lite-format=tflite",
+    },
+}
+
+POSE_BENCHMARK_PATH = Path(__file__).parent / "pose_benchmark.json"
+MODEL_CACHE_DIR = Path(__file__).parent / CONFIG["model_cache_dir"]
+MODEL_MANIFEST_PATH = MODEL_CACHE_DIR / "manifest.json"  # model adı -> sha256
+model_cache_lock = threading.Lock()
+
+def file_sha256(path):
+    """Dosyayı mmap üzerinden özetler; Python tarafında kopya oluşmaz, sayfalar önbellekte paylaşılır"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+def load_model_manifest():
+    try:
+        with open(MODEL_MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def trusted_model_digest(name):
+    """Modelin ayarlarda ya da POSE_MODELS içinde sabitlenmiş sha256 özetini döndürür; yoksa None"""
+    expected = CONFIG["model_sha256"].get(name) or POSE_MODELS[name].get("sha256")
+    return expected.lower() if expected else None
+
+def add_model_to_cache(name, source_path):
+    """Dosyayı sabitlenmiş özetle doğrular, içerik özetiyle adlandırıp önbelleğe kopyalar ve manifestte modele bağlar"""
+    expected = trusted_model_digest(name)
+    digest = file_sha256(source_path)
+    if expected is None:
+        print(f"{name} modelinin özeti sabitlenmemiş; ilk görülen özet manifestte sabitlendi: {digest}")
+    elif digest != expected:
+        raise ValueError(f"{name} modelinin özeti beklenenden farklı: {digest}")
+    MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    target = MODEL_CACHE_DIR / f"{digest}.tflite"
+    if not target.exists():
+        temp_path = target.with_suffix(".part")
+        shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, target)
+    with model_cache_lock:
+        manifest = load_model_manifest()
+        manifest[name] = {"sha256": digest, "url": POSE_MODELS[name]["url"]}
+        temp_path = MODEL_MANIFEST_PATH.with_suffix(".part")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, MODEL_MANIFEST_PATH)
+    return target
+
+def download_model(name):
+    """Modeli indirir ve önbelleğe ekler; GUI iş parçacığından çağrılmamalıdır"""
+    MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temp_path = MODEL_CACHE_DIR / f"{name}.download"
+    print(f"{name} modeli indiriliyor...")
+    try:
+        urllib.request.urlretrieve(POSE_MODELS[name]["url"], temp_path)
+        return add_model_to_cache(name, temp_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+def resolve_model_path(name, allow_download=None):
+    """Modeli ağa çıkmadan önbellekten bulur ve özetini doğrular; yalnızca izin varsa indirir"""
+    if allow_download is None:
+        allow_download = CONFIG["model_download_allowed"]
+    expected = trusted_model_digest(name)
+    entry = load_model_manifest().get(name)
+    if entry and expected in (None, entry["sha256"]):
+        path = MODEL_CACHE_DIR / f"{entry['sha256']}.tflite"
+        if path.exists() and file_sha256(path) == entry["sha256"]:
+            return str(path)
+        print(f"Önbellekteki {name} modeli eksik ya da bozuk")
+        if path.exists():
+            path.unlink()  # Aynı içerik yeniden eklenebilsin
+    # Eski sürümlerin çalışma dizinine indirdiği dosya varsa önbelleğe alınır
+    legacy_path = Path(POSE_MODELS[name]["file"])
+    if legacy_path.exists():
+        return str(add_model_to_cache(name, legacy_path))
+    if allow_download:
+        return str(download_model(name))
+    raise FileNotFoundError(f"{name} modeli önbellekte yok; --provision ile hazırlayın "
+                            f"ya da model_download_allowed ayarını açın")
+
+def provision():
+    """Bağlantılı bir makinede çevrimdışı kurulum için tekerlek deposunu ve model önbelleğini hazırlar"""
+    distributions = sorted({DISTRIBUTION_NAMES.get(pkg, pkg) for pkg in REQUIRED_PACKAGES})
+    print(f"Tekerlek deposu hazırlanıyor: {WHEELHOUSE_DIR}")
+    ok = subprocess.call([sys.executable, '-m', 'pip', 'download', '--disable-pip-version-check',
+                          '-d', WHEELHOUSE_DIR, *distributions]) == 0
+    for name in POSE_MODELS:
+        try:
+            path = resolve_model_path(name, allow_download=True)
+            print(f"{name}: {path}")
+        except Exception as e:
+            print(f"HATA: {name} modeli hazırlanamadı: {e}")
+            ok = False
+    return ok
+
+def load_tflite_interpreter_class():
+    """Varsa hafif tflite_runtime paketini, yoksa TensorFlow'un yorumlayıcısını döndürür"""
+    try:
+        from tflite_runtime.interpreter import Interpreter, OpResolverType
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+        OpResolverType = tf.lite.experimental.OpResolverType
+    return Interpreter, OpResolverType
+
+def create_tflite_interpreter(model_path, num_threads=None, delegate="xnnpack"):
     """
-    Gereksinimleri kontrol et ve yükle.
-    Temiz bir çözüm için GUI gereksinimlerini ayrı bir süreçte çalıştırır.
+    Yorumlayıcıyı iş parçacığı sayısı ve delege seçimiyle oluşturur.
+    model_path bilerek kullanılır: TFLite dosyayı salt okunur mmap ile eşler, böylece aynı
+    modeli açan yorumlayıcılar ve yeniden başlatmalar sayfa önbelleğini paylaşır. model_content
+    ise yalnızca bytes kabul eder ve modelin süreç içinde ayrı bir kopyasını tutar.
     """
-    # İlk olarak PySide6 yüklü mü kontrol et, yoksa yükle
-    if importlib.util.find_spec('PySide6') is None:
-        print("PySide6 yükleniyor...")
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'PySide6'])
-    
-    # GUI'yi ayrı süreçte çalıştır
-    create_gui_script()
+    Interpreter, OpResolverType = load_tflite_interpreter_class()
+    kwargs = {"model_path": model_path}
+    if num_threads:
+        kwargs["num_threads"] = num_threads
+    if delegate == "none":
+        # Varsayılan XNNPACK delegesi olmadan yalnızca yerleşik çekirdekler
+        kwargs["experimental_op_resolver_type"] = OpResolverType.BUILTIN_WITHOUT_DEFAULT_DELEGATES
+    interpreter = Interpreter(**kwargs)
+    interpreter.allocate_tensors()
+    return interpreter
 
-# Gereksinim kontrolü yapan fonksiyonu çağır
-if __name__ == "__main__":
-    check_requirements()
-    
-    # Buradan sonra ana program devam eder...
+def time_interpreter(interpreter, runs=8, warmup=2):
+    """Boş girdiyle ortanca çağrı süresini milisaniye olarak ölçer"""
+    details = interpreter.get_input_details()[0]
+    dummy = np.zeros(details['shape'], dtype=details['dtype'])
+    timings = []
+    for i in range(warmup + runs):
+        start = time.perf_counter()
+        interpreter.set_tensor(details['index'], dummy)
+        interpreter.invoke()
+        if i >= warmup:
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
 
+def benchmark_interpreter_settings(model_path):
+    """Bu makine için en hızlı (iş parçacığı, delege) ayarını bulur; sonuç dosyada önbelleklenir"""
+    cpu_count = os.cpu_count() or 1
+    key = f"{os.path.basename(model_path)}:{cpu_count}"
+    try:
+        with open(POSE_BENCHMARK_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        cache = {}
+    if key in cache:
+        return cache[key]["num_threads"], cache[key]["delegate"]
 
+    thread_options = sorted({n for n in (1, 2, 4, cpu_count) if n <= cpu_count})
+    best = None
+    for delegate in ("xnnpack", "none"):
+        for num_threads in thread_options:
+            try:
+                latency = time_interpreter(create_tflite_interpreter(model_path, num_threads, delegate))
+            except Exception as e:
+                print(f"Ayar denenemedi ({num_threads} iş parçacığı, {delegate}): {e}")
+                continue
+            print(f"{os.path.basename(model_path)}: {num_threads} iş parçacığı, {delegate} -> {latency:.1f} ms")
+            if best is None or latency < best[0]:
+                best = (latency, num_threads, delegate)
+    if best is None:
+        return None, "xnnpack"
+    cache[key] = {"num_threads": best[1], "delegate": best[2], "latency_ms": round(best[0], 2)}
+    try:
+        with open(POSE_BENCHMARK_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"Kıyaslama sonucu kaydedilemedi: {e}")
+    return best[1], best[2]
 
+class FrameScheduler(QObject):
+    """Tüm animasyonlu bileşenleri tek saatten süren; yük altında önce süs efektlerini yavaşlatır"""
+    CRITICAL = 0  # Sensör görüntüleri, hiçbir zaman yavaşlatılmaz
+    NORMAL = 1
+    DECORATIVE = 2  # Parçacıklar ve ışık huzmeleri
+    MAX_DEGRADE_LEVEL = 4  # Bu seviyede süs efektleri tamamen durur
 
+    def __init__(self, interval_ms=16):
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.tasks = []
+        self.degrade_level = 0  # Süs efektlerinin periyodu 2 ** seviye ile çarpılır
+        self.suspended = False  # Pencere görünmezken saat tamamen durur
+        self.avg_frame_ms = float(interval_ms)
+        self.avg_work_ms = 0.0
+        self.over_budget_ticks = 0
+        self.under_budget_ticks = 0
+        self.last_tick = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
 
+    def add(self, callback, interval_ms, priority=NORMAL):
+        """Bileşeni saate ekler; kaldırmak için remove()'a verilecek görevi döndürür"""
+        task = {"callback": callback, "interval_ms": interval_ms, "priority": priority,
+                "last_run": time.perf_counter()}
+        self.tasks.append(task)
+        if not self.timer.isActive() and not self.suspended:
+            self.timer.start(self.interval_ms)
+        return task
 
-import sys
-import random
-import time
-import math
-from pathlib import Path
-import json
-import requests
-from datetime import datetime
-import threading
-import resources_rc
-from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, 
-                              QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton,
-                              QGraphicsBlurEffect)
-from PySide6.QtCore import (Qt, QTimer, QPropertyAnimation, QRect, QSize, 
-                           QEasingCurve, QPoint, Slot, QThread, Signal, QObject)
-from PySide6.QtGui import (QColor, QPainter, QPen, QBrush, QFont, 
-                          QFontMetrics, QGradient, QLinearGradient, QRadialGradient, 
-                          QPainterPath, QPixmap, QIcon, QImage)
-from PySide6.QtGui import QTransform
-import cv2  # OpenCV kütüphanesini ekliyoruz
-import tensorflow as tf
-import numpy as np
-import os
-import urllib.request
+    def remove(self, task):
+        if task in self.tasks:
+            self.tasks.remove(task)
+
+    def set_suspended(self, suspended):
+        """Pencere görünmezken saati durdurur; geri gelince gecikmiş görevler hemen çalışır"""
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+        if suspended:
+            self.timer.stop()
+        else:
+            self.last_tick = None  # Askıdaki süre kare süresi ortalamasını bozmasın
+            self.timer.start(self.interval_ms)
+            self.tick()
+
+    def effective_interval(self, task):
+        if task["priority"] != self.DECORATIVE:
+            return task["interval_ms"]
+        if self.degrade_level >= self.MAX_DEGRADE_LEVEL:
+            return None
+        return task["interval_ms"] * (2 ** self.degrade_level)
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            self.avg_frame_ms = 0.9 * self.avg_frame_ms + 0.1 * (now - self.last_tick) * 1000
+        self.last_tick = now
+        for task in list(self.tasks):
+            interval = self.effective_interval(task)
+            if interval is None:
+                continue
+            # Yarım saat periyodu tolerans: 30 ms'lik görev 16 ms'lik saatte her 2 tikte çalışır
+            if (now - task["last_run"]) * 1000 < interval - self.interval_ms / 2:
+                continue
+            task["last_run"] = now
+            task["callback"]()
+        work_ms = (time.perf_counter() - now) * 1000
+        self.avg_work_ms = 0.9 * self.avg_work_ms + 0.1 * work_ms
+        self.adapt()
+
+    def adapt(self):
+        """Saat gecikirse ya da iş süresi bütçeyi aşarsa süs efektlerini bir kademe düşürür"""
+        over_budget = (self.avg_frame_ms > self.interval_ms * 1.5
+                       or self.avg_work_ms > self.interval_ms * 0.5)
+        if over_budget:
+            self.under_budget_ticks = 0
+            self.over_budget_ticks += 1
+            if self.over_budget_ticks >= 20 and self.degrade_level < self.MAX_DEGRADE_LEVEL:
+                self.degrade_level += 1
+                self.over_budget_ticks = 0
+                print(f"Kare süresi {self.avg_frame_ms:.1f} ms, süs efektleri seviye {self.degrade_level}")
+        else:
+            self.over_budget_ticks = 0
+            self.under_budget_ticks += 1
+            if self.under_budget_ticks >= 200 and self.degrade_level > 0:
+                self.degrade_level -= 1
+                self.under_budget_ticks = 0
+
+_frame_scheduler = None
+
+def frame_scheduler():
+    """Uygulama genelindeki tek FrameScheduler örneğini döndürür"""
+    global _frame_scheduler
+    if _frame_scheduler is None:
+        _frame_scheduler = FrameScheduler(CONFIG["frame_interval_ms"])
+    return _frame_scheduler
+
+# Parçacık durumu tek bir yapılandırılmış dizide tutulur; adım ve sarma işlemleri vektörel
+PARTICLE_DTYPE = np.dtype([
+    ('x', np.float32), ('y', np.float32),
+    ('vx', np.float32), ('vy', np.float32),
+    ('size', np.float32),
+    ('color', np.uint8),  # PARTICLE_COLORS içindeki indeks
+    ('rgba', np.uint8, 4),
+])
+PARTICLE_COLORS = np.array([
+    (255, 222, 173), (238, 203, 173), (222, 184, 135), (245, 222, 179), (210, 180, 140)
+], dtype=np.uint8)
+PARTICLE_MAX_SIZE = 18
+PARTICLE_BLUR = 4  # Sprite'lara önceden uygulanan yumuşatma payı (piksel)
+DIRTY_TILE_SIZE = 64  # Kısmi yeniden çizim için ekranın bölündüğü kare boyutu
+
+def create_particles(count, width, height):
+    """Rastgele konum, hız, boyut ve ten renkleriyle parçacık dizisi oluşturur"""
+    rng = np.random.default_rng()
+    particles = np.zeros(count, dtype=PARTICLE_DTYPE)
+    particles['x'] = rng.integers(0, width + 1, count)
+    particles['y'] = rng.integers(0, height + 1, count)
+    particles['size'] = rng.integers(1, PARTICLE_MAX_SIZE + 1, count)  # Daha geniş boyut aralığı
+    particles['vx'] = rng.uniform(-0.5, 0.5, count)
+    particles['vy'] = rng.uniform(-0.5, 0.5, count)
+    particles['color'] = rng.integers(0, len(PARTICLE_COLORS), count)
+    particles['rgba'][:, :3] = PARTICLE_COLORS[particles['color']]
+    # Büyük parçacıklar daha opak: 0.3-1.0 arası boyut çarpanı * 0.2-0.6 arası opaklık
+    opacity = rng.uniform(0.2, 0.6, count)
+    opacity_factor = 0.3 + (particles['size'] / 25.0) * 0.7
+    particles['rgba'][:, 3] = (255 * opacity_factor * opacity).astype(np.uint8)
+    return particles
+
+def build_particle_atlas():
+    """Her (renk, boyut) için önceden yumuşatılmış yuvarlak sprite'ları tek bir pixmap'te toplar"""
+    cell = int(math.ceil(PARTICLE_MAX_SIZE * 1.2)) + 2 * PARTICLE_BLUR
+    atlas = QPixmap(cell * PARTICLE_MAX_SIZE, cell * len(PARTICLE_COLORS))
+    atlas.fill(Qt.transparent)
+    painter = QPainter(atlas)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    for row, (r, g, b) in enumerate(PARTICLE_COLORS.tolist()):
+        for size in range(1, PARTICLE_MAX_SIZE + 1):
+            radius = size * 1.2 / 2  # Boyutu %20 artır
+            outer = radius + PARTICLE_BLUR
+            center = QPoint((size - 1) * cell + cell // 2, row * cell + cell // 2)
+            # Eski tam ekran bulanıklığının yerine kenarları yumuşak düşen radyal gradyan
+            peak = min(1.0, radius / PARTICLE_BLUR)
+            gradient = QRadialGradient(center, outer)
+            gradient.setColorAt(0, QColor(r, g, b, int(255 * peak)))
+            gradient.setColorAt(max(0.0, radius - PARTICLE_BLUR / 2) / outer, QColor(r, g, b, int(255 * peak)))
+            gradient.setColorAt(1, QColor(r, g, b, 0))
+            painter.setBrush(gradient)
+            painter.drawEllipse(center, outer, outer)
+    painter.end()
+    return atlas, cell
+
+def step_particles(particles, width, height, scale=1.0):
+    """Parçacıkları hızları kadar ilerletir, ekrandan çıkanları karşı kenardan geri sokar"""
+    particles['x'] += particles['vx'] * scale
+    particles['y'] += particles['vy'] * scale
+    size = particles['size']
+    for axis, limit in (('x', width), ('y', height)):
+        position = particles[axis]
+        position[:] = np.where(position < -size, limit + size,
+                               np.where(position > limit + size, -size, position))
+
+class ParticleLayer:
+    """
+    Parçacık katmanının NumPy tamponu ve onu kopyalamadan saran QImage.
+    Sprite'lar ekran dışına taşabildiği için tampon her kenarda pad piksel geniştir; böylece
+    birleştirmede sınır denetimi gerekmez. Görünen kısım source_rect ile seçilir.
+    """
+    def __init__(self, width, height, pad):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+        # Küçük sonlu makinede 0xAARRGGBB sayısı Format_ARGB32_Premultiplied bayt düzenidir
+        self.pixels = np.zeros((height + 2 * pad) * self.stride, dtype=np.uint32)
+        self.image = QImage(self.pixels.data, self.stride, height + 2 * pad, self.stride * 4,
+                            QImage.Format_ARGB32_Premultiplied)
+        self.source_rect = QRect(pad, pad, width, height)
+
+class ParticleLayerRenderer(QObject):
+    """
+    Parçacık katmanını GUI dışında NumPy ile birleştirir; parçacık başına Python çağrısı yapılmaz.
+    İki önceden ayrılmış katman dönüşümlü kullanılır: GUI birini çizerken diğeri doldurulur ve GUI
+    eskisini release() ile geri verene kadar yeniden yazılmaz. Yalnızca en son istenen konumlar
+    çizilir; renderer geride kalırsa aradaki istekler düşürülür.
+    """
+    layer_ready = Signal(object, object, object)  # (ParticleLayer, x, y): katman ve çizildiği konumlar
+
+    def __init__(self, particles, atlas, cell):
+        super().__init__()
+        self.cell = cell
+        self.pad = 2 * cell  # Ekrandan en fazla boyut + cell / 2 kadar taşan sprite'lar için
+        # Boyut, renk ve opaklık sabit: her parçacığın görünür sprite pikselleri bir kez açılır
+        image = atlas.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        atlas_pixels = np.frombuffer(image.constBits(), dtype=np.uint32).reshape(
+            image.height(), image.bytesPerLine() // 4)
+        rows = np.arange(cell)
+        sprites = atlas_pixels[
+            (particles['color'].astype(np.intp) * cell)[:, None, None] + rows[None, :, None],
+            ((particles['size'].astype(np.intp) - 1) * cell)[:, None, None] + rows[None, None, :],
+        ]  # (parçacık, y, x)
+        # Önceden çarpılmış pikselde opaklık tüm kanalları aynı oranda ölçekler
+        opacity = particles['rgba'][:, 3].astype(np.float32)[:, None, None] / 255
+        channels = sprites[..., None].view(np.uint8).astype(np.float32) * opacity[..., None]
+        sprites = (channels + 0.5).astype(np.uint8).view(np.uint32)[..., 0]
+        # Alfası 4/255'in altındaki hale pikselleri görünmez; yazılmaz
+        particle, dy, dx = np.nonzero(sprites >> 24 >= 4)
+        values = sprites[particle, dy, dx]
+        # Artan opaklık seviyesine göre sıralanır: üst üste binen noktada daha opak piksel en son yazılıp
+        # kalır, karede düz atama yeterli olur. Seviye içinde parçacık sırası korunur ve yazmalar
+        # bellekte yakın kalır
+        order = np.argsort(values >> 28, kind="stable")
+        self.pixel_particle, self.pixel_dy, self.pixel_dx = particle[order], dy[order], dx[order]
+        self.pixel_values = values[order]
+        self.stride = None  # pixel_offsets hangi katman genişliği için hesaplandı
+        self.pixel_offsets = None
+        self.free_layers = []
+        self.condition = threading.Condition()
+        self.pending = None  # (genişlik, yükseklik, x, y)
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, width, height, x, y):
+        with self.condition:
+            self.pending = (width, height, x, y)  # Henüz çizilmemiş eski istek ezilir
+            self.condition.notify()
+
+    def release(self, layer):
+        """GUI artık göstermediği katmanı yeniden doldurulmak üzere geri verir"""
+        with self.condition:
+            self.free_layers.append(layer)
+            self.condition.notify()
+
+    def run(self):
+        layers_allocated = 0
+        while True:
+            with self.condition:
+                # Her iki katman da GUI'deyse biri geri verilene kadar beklenir
+                while self.running and (self.pending is None or
+                                        (not self.free_layers and layers_allocated >= 2)):
+                    self.condition.wait()
+                if not self.running:
+                    return
+                width, height, x, y = self.pending
+                self.pending = None
+                layer = self.free_layers.pop() if self.free_layers else None
+            if layer is None:
+                layers_allocated += 1
+            elif (layer.width, layer.height) != (width, height):
+                layer = None  # Pencere boyutu değişti; eski boyuttaki katman bırakılır
+            if layer is None:
+                layer = ParticleLayer(width, height, self.pad)
+            self.render(layer, x, y)
+            self.layer_ready.emit(layer, x, y)
+
+    def render(self, layer, x, y):
+        if self.stride != layer.stride:
+            self.stride = layer.stride
+            self.pixel_offsets = (self.pixel_dy * layer.stride + self.pixel_dx).astype(np.intp)
+        half = self.cell / 2
+        left = np.clip((x - half).astype(np.intp) + self.pad, 0, layer.width + self.pad)
+        top = np.clip((y - half).astype(np.intp) + self.pad, 0, layer.height + self.pad)
+        layer.pixels.fill(0)
+        layer.pixels[(top * layer.stride + left)[self.pixel_particle] + self.pixel_offsets] = self.pixel_values
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join(1)
 
 class BackgroundEffects(QWidget):
     def __init__(self, parent=None):
@@ -297,21 +965,12 @@ class BackgroundEffects(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.screen_width = QApplication.primaryScreen().size().width()
         self.screen_height = QApplication.primaryScreen().size().height()
-        self.particles = [{
-            'x': random.randint(0, self.screen_width),
-            'y': random.randint(0, self.screen_height),
-            'size': random.randint(1, 18),  # Daha geniş boyut aralığı
-            'speed_x': random.uniform(-0.5, 0.5),
-            'speed_y': random.uniform(-0.5, 0.5),
-            'opacity': random.uniform(0.2, 0.6),  # Opaklık değerlerini arttırdım
-            'color': random.choice([
-                QColor(255, 222, 173, int(255 * random.uniform(0.2, 0.5))),  # Opaklığı arttırdım
-                QColor(238, 203, 173, int(255 * random.uniform(0.2, 0.5))),
-                QColor(222, 184, 135, int(255 * random.uniform(0.2, 0.5))),
-                QColor(245, 222, 179, int(255 * random.uniform(0.2, 0.5))),
-                QColor(210, 180, 140, int(255 * random.uniform(0.2, 0.5)))
-            ])
-        } for _ in range(200)]  # Parçacık sayısını azalttım ancak çeşitli boyutlarda
+        self.particles = create_particles(CONFIG["particle_count"], self.screen_width, self.screen_height)
+        particle_atlas, self.atlas_cell = build_particle_atlas()
+        self.particle_renderer = ParticleLayerRenderer(self.particles, particle_atlas, self.atlas_cell)
+        self.particle_renderer.layer_ready.connect(self.on_particle_layer)
+        self.particle_layer = None  # Son çizilen parçacık katmanı ve içindeki konumlar
+        self.layer_x = self.layer_y = None
         self.main_light_beam = {
             'origin_x': -200,  # Sol üst köşeden başlayıp dışarıdan gelecek
             'origin_y': -200,
@@ -338,120 +997,149 @@ class BackgroundEffects(QWidget):
             'phase': random.uniform(0, 2 * math.pi),
             'speed': 0.01 + 0.005 * i
         } for i in range(4)]  # 4 farklı ikincil ışık demeti
+        # Gradyan ve huzmeler ekran dışı pixmap'lerde tutulur, yalnızca boyut değişince yeniden çizilir
+        self.background_layer = None
+        self.beam_layers = []
+        self.beam_alphas = self.current_beam_alphas()
+        self.static_layers_dirty = True
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_effects)
-        self.timer.start(30)
-        self.blur_effect = QGraphicsBlurEffect()
-        self.blur_effect.setBlurRadius(8)  # Bulanıklık miktarını artırdım
-        self.setGraphicsEffect(self.blur_effect)
+        # Süs efekti: yük altında ortak saat tarafından yavaşlatılabilir
+        self.last_update = time.perf_counter()
+        self.frame_task = frame_scheduler().add(self.update_effects, 30, FrameScheduler.DECORATIVE)
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.screen_width = QApplication.primaryScreen().size().width()
         self.screen_height = QApplication.primaryScreen().size().height()
-        for p in self.particles:
-            p['x'] = random.randint(0, self.screen_width)
-            p['y'] = random.randint(0, self.screen_height)
+        count = len(self.particles)
+        self.particles['x'] = np.random.randint(0, self.screen_width + 1, count)
+        self.particles['y'] = np.random.randint(0, self.screen_height + 1, count)
         self.main_light_beam['length'] = self.screen_width * 1.5
         self.main_light_beam['width_end'] = self.screen_width
         for beam in self.secondary_beams:
             beam['length'] = self.screen_width * random.uniform(0.8, 1.2)
+        self.static_layers_dirty = True
 
-    def update_effects(self):
-        self.screen_width = QApplication.primaryScreen().size().width()
-        self.screen_height = QApplication.primaryScreen().size().height()
-        for p in self.particles:
-            p['x'] += p['speed_x']
-            p['y'] += p['speed_y']
-            if p['x'] < -p['size']:
-                p['x'] = self.screen_width + p['size']
-            elif p['x'] > self.screen_width + p['size']:
-                p['x'] = -p['size']
-                
-            if p['y'] < -p['size']:
-                p['y'] = self.screen_height + p['size']
-            elif p['y'] > self.screen_height + p['size']:
-                p['y'] = -p['size']
-        self.main_light_beam['phase'] += self.main_light_beam['speed']
-        pulse_factor = 0.15 * math.sin(self.main_light_beam['phase']) + 0.85  # Işık yanıp sönmesi
-        self.main_light_beam['opacity'] = 0.12 * pulse_factor
-        for beam in self.secondary_beams:
-            beam['phase'] += beam['speed']
-            beam_pulse = 0.2 * math.sin(beam['phase']) + 0.8
-            beam['opacity'] = (0.05 + 0.02 * beam_pulse) * pulse_factor
-        
-        self.update()
+    def current_beam_alphas(self):
+        """Huzmelerin o anki opaklığını çizimde kullanılan tam sayı alfa değerleri olarak döndürür"""
+        beams = [self.main_light_beam] + self.secondary_beams
+        return [int(255 * beam['opacity']) for beam in beams]
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def render_beam_layer(self, beam, end_alpha):
+        """Huzmeyi tam opaklıkta ayrı bir pixmap'e çizer; kare başına yalnızca opaklığı değişir"""
+        layer = QPixmap(self.size())
+        layer.fill(Qt.transparent)
+        painter = QPainter(layer)
         painter.setRenderHint(QPainter.Antialiasing)
-        screen_width = self.screen_width
-        screen_height = self.screen_height
-        gradient = QLinearGradient(0, 0, 0, screen_height)
-        gradient.setColorAt(0, QColor(20, 20, 40))
-        gradient.setColorAt(1, QColor(10, 10, 20))
-        painter.fillRect(self.rect(), gradient)
-        painter.save()
         transform = QTransform()
-        transform.translate(self.main_light_beam['origin_x'], self.main_light_beam['origin_y'])
-        transform.rotate(self.main_light_beam['angle'])
+        transform.translate(beam['origin_x'], beam['origin_y'])
+        transform.rotate(beam['angle'])
         painter.setTransform(transform)
-        beam_gradient = QLinearGradient(0, 0, self.main_light_beam['length'], 0)
-        start_color = self.main_light_beam['color_start']
-        start_color.setAlpha(int(255 * self.main_light_beam['opacity']))
-        end_color = self.main_light_beam['color_end']
-        end_color.setAlpha(int(10 * self.main_light_beam['opacity']))
-        
+        # Alfa opaklıkla doğrusal ölçeklendiği için 1.0 opaklıkta çizip setOpacity ile birleştirmek eşdeğer
+        start_color = QColor(beam['color_start'])
+        start_color.setAlpha(255)
+        end_color = QColor(beam['color_end'])
+        end_color.setAlpha(end_alpha)
+        beam_gradient = QLinearGradient(0, 0, beam['length'], 0)
         beam_gradient.setColorAt(0, start_color)
         beam_gradient.setColorAt(1, end_color)
         beam_path = QPainterPath()
         beam_path.moveTo(0, 0)
-        beam_path.lineTo(self.main_light_beam['length'], -self.main_light_beam['width_end'] / 2)
-        beam_path.lineTo(self.main_light_beam['length'], self.main_light_beam['width_end'] / 2)
+        beam_path.lineTo(beam['length'], -beam['width_end'] / 2)
+        beam_path.lineTo(beam['length'], beam['width_end'] / 2)
         beam_path.closeSubpath()
-        
         painter.fillPath(beam_path, beam_gradient)
-        painter.restore()
+        painter.end()
+        return layer
+
+    def render_static_layers(self):
+        self.background_layer = QPixmap(self.size())
+        painter = QPainter(self.background_layer)
+        gradient = QLinearGradient(0, 0, 0, self.screen_height)
+        gradient.setColorAt(0, QColor(20, 20, 40))
+        gradient.setColorAt(1, QColor(10, 10, 20))
+        painter.fillRect(self.rect(), gradient)
+        painter.end()
+        self.beam_layers = [self.render_beam_layer(self.main_light_beam, 10)]
+        self.beam_layers += [self.render_beam_layer(beam, 5) for beam in self.secondary_beams]
+        self.static_layers_dirty = False
+
+    def particle_dirty_region(self, old_x, old_y, new_x, new_y):
+        """Parçacıkların eski ve yeni konumlarının kapladığı ekran karelerini birleşik bölge olarak döndürür"""
+        tile = DIRTY_TILE_SIZE
+        half = self.atlas_cell / 2
+        columns = self.width() // tile + 1
+        rows = self.height() // tile + 1
+        xs = np.concatenate((old_x, new_x))
+        ys = np.concatenate((old_y, new_y))
+        # Sprite kare boyutundan küçük olduğu için en fazla 2x2 kareye taşar
+        x0 = np.clip(((xs - half) // tile).astype(np.int32), 0, columns - 1)
+        x1 = np.clip(((xs + half) // tile).astype(np.int32), 0, columns - 1)
+        y0 = np.clip(((ys - half) // tile).astype(np.int32), 0, rows - 1)
+        y1 = np.clip(((ys + half) // tile).astype(np.int32), 0, rows - 1)
+        dirty = np.zeros((rows, columns), dtype=bool)
+        dirty[y0, x0] = dirty[y0, x1] = dirty[y1, x0] = dirty[y1, x1] = True
+        region = QRegion()
+        for row in np.flatnonzero(dirty.any(axis=1)).tolist():
+            # Satırdaki ardışık kirli kareler tek dikdörtgende birleştirilir
+            edges = np.diff(np.concatenate(([0], dirty[row].astype(np.int8), [0])))
+            for start, end in zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()):
+                region += QRect(start * tile, row * tile, (end - start) * tile, tile)
+        return region
+
+    def update_effects(self):
+        self.screen_width = QApplication.primaryScreen().size().width()
+        self.screen_height = QApplication.primaryScreen().size().height()
+        # Saat yavaşlatılsa da hareket hızı aynı kalsın diye adım geçen süreyle ölçeklenir
+        now = time.perf_counter()
+        scale = min(10.0, (now - self.last_update) / 0.03)
+        self.last_update = now
+        step_particles(self.particles, self.screen_width, self.screen_height, scale)
+        self.particle_renderer.submit(self.width(), self.height(),
+                                      self.particles['x'].copy(), self.particles['y'].copy())
+        self.main_light_beam['phase'] += self.main_light_beam['speed'] * scale
+        pulse_factor = 0.15 * math.sin(self.main_light_beam['phase']) + 0.85  # Işık yanıp sönmesi
+        self.main_light_beam['opacity'] = 0.12 * pulse_factor
         for beam in self.secondary_beams:
-            painter.save()
-            transform = QTransform()
-            transform.translate(beam['origin_x'], beam['origin_y'])
-            transform.rotate(beam['angle'])
-            painter.setTransform(transform)
-            sec_beam_gradient = QLinearGradient(0, 0, beam['length'], 0)
-            sec_start_color = beam['color_start']
-            sec_start_color.setAlpha(int(255 * beam['opacity']))
-            sec_end_color = beam['color_end']
-            sec_end_color.setAlpha(int(5 * beam['opacity']))
-            
-            sec_beam_gradient.setColorAt(0, sec_start_color)
-            sec_beam_gradient.setColorAt(1, sec_end_color)
-            sec_beam_path = QPainterPath()
-            sec_beam_path.moveTo(0, 0)
-            sec_beam_path.lineTo(beam['length'], -beam['width_end'] / 2)
-            sec_beam_path.lineTo(beam['length'], beam['width_end'] / 2)
-            sec_beam_path.closeSubpath()
-            
-            painter.fillPath(sec_beam_path, sec_beam_gradient)
-            painter.restore()
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-        
-        for p in self.particles:
-            size_factor = p['size'] / 25.0
-            opacity_factor = 0.3 + (size_factor * 0.7)  # Değerleri 0.3-1.0 arasında tutar
-            particle_color = p['color']
-            particle_color.setAlpha(int(255 * opacity_factor * p['opacity']))
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(particle_color)
-            particle_size = p['size'] * 1.2  # Boyutu %20 artır
-            painter.drawEllipse(
-                int(p['x'] - particle_size/2), 
-                int(p['y'] - particle_size/2), 
-                particle_size, 
-                particle_size
-            )
+            beam['phase'] += beam['speed'] * scale
+            beam_pulse = 0.2 * math.sin(beam['phase']) + 0.8
+            beam['opacity'] = (0.05 + 0.02 * beam_pulse) * pulse_factor
+
+        beam_alphas = self.current_beam_alphas()
+        if self.static_layers_dirty or beam_alphas != self.beam_alphas:
+            # Huzme parlaklığı değişti: tüm ekran yeniden çizilir (birkaç karede bir)
+            self.beam_alphas = beam_alphas
+            self.update()
+
+    @Slot(object, object, object)
+    def on_particle_layer(self, layer, x, y):
+        """Arka planda çizilen katmanı alır; yalnızca parçacıkların eski ve yeni kareleri yeniden çizilir"""
+        previous = self.particle_layer
+        if previous is None or (layer.width, layer.height) != (self.width(), self.height()):
+            self.update()
+        else:
+            self.update(self.particle_dirty_region(self.layer_x, self.layer_y, x, y))
+        self.particle_layer, self.layer_x, self.layer_y = layer, x, y
+        if previous is not None:
+            # Yeni katman bir sonraki çizimde kullanılacak; eskisi renderer'a geri verilir
+            self.particle_renderer.release(previous)
+
+    def paintEvent(self, event):
+        first_paint = self.background_layer is None
+        if self.static_layers_dirty or self.background_layer.size() != self.size():
+            self.render_static_layers()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.background_layer)
+        for layer, alpha in zip(self.beam_layers, self.beam_alphas):
+            painter.setOpacity(alpha / 255)
+            painter.drawPixmap(0, 0, layer)
+        painter.setOpacity(1.0)
+        # Parçacık sayısından bağımsız tek çizim; katman ParticleLayerRenderer'da hazırlanır
+        if self.particle_layer is not None:
+            layer = self.particle_layer
+            painter.drawImage(QPoint(0, 0), layer.image, layer.source_rect)
+        if first_paint:
+            mark_startup("ilk çizim")
 
 class SignalStrengthIndicator(QWidget):
     def __init__(self, parent=None):
@@ -490,10 +1178,14 @@ class SignalStrengthIndicator(QWidget):
                 QColor(200, 200, 200)
             )
 
+# Izgaradaki tüm karoların ve kamera karelerinin boyutu; ızgara geometrisi de buradan hesaplanır
+TILE_SIZE = QSize(450, 315)
+TILE_SPACING = 45
+
 class SensorTile(QWidget):
     def __init__(self, title, parent=None):
         super().__init__(parent)
-        self.setFixedSize(450, 315)  # Ekranda düzgün görünmesi için boyutu ayarlandı
+        self.setFixedSize(TILE_SIZE)  # Ekranda düzgün görünmesi için boyutu ayarlandı
         self.title = title
         self.has_signal = False
         self.signal_strength = 0
@@ -511,9 +1203,7 @@ class SensorTile(QWidget):
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setStyleSheet("color: #888888; font-size: 21px;")
         layout.addWidget(self.status_label)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate_signal)
-        self.timer.start(1000)  # Check signal every second
+        self.signal_task = frame_scheduler().add(self.animate_signal, 1000)  # Check signal every second
     
     def animate_signal(self):
         if random.random() < 0.1:  # 10% chance to change signal status
@@ -539,108 +1229,480 @@ class SensorTile(QWidget):
         painter.setPen(QPen(QColor(50, 50, 50, 100), 1))
         painter.drawPath(path)
 
+def put_latest(q, item):
+    """Kuyruk doluysa en eski öğeyi atıp yenisini ekler, hiçbir zaman bloklamaz"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+class PoseBackend:
+    """Tek bir MoveNet TFLite modelini yükler ve çalıştırır"""
+    def __init__(self, name, num_threads="auto", delegate="auto"):
+        self.name = name
+        load_start = time.perf_counter()
+        self.model_path = resolve_model_path(name)
+        verify_ms = (time.perf_counter() - load_start) * 1000
+        if num_threads == "auto" or delegate == "auto":
+            best_threads, best_delegate = benchmark_interpreter_settings(self.model_path)
+            num_threads = best_threads if num_threads == "auto" else num_threads
+            delegate = best_delegate if delegate == "auto" else delegate
+        self.num_threads = num_threads
+        self.delegate = delegate
+        interpreter_start = time.perf_counter()
+        self.interpreter = create_tflite_interpreter(self.model_path, num_threads, delegate)
+        interpreter_ms = (time.perf_counter() - interpreter_start) * 1000
+        self.load_ms = (time.perf_counter() - load_start) * 1000
+        print(f"{name} modeli {self.load_ms:.1f} ms'de yüklendi "
+              f"(özet doğrulama {verify_ms:.1f} ms, yorumlayıcı {interpreter_ms:.1f} ms)")
+        self.input_details = self.interpreter.get_input_details()
+        self.output_details = self.interpreter.get_output_details()
+        self.input_size = tuple(int(v) for v in self.input_details[0]['shape'][1:3])  # (yükseklik, genişlik)
+        self.last_latency_ms = 0.0
+
+    def preprocess(self, image):
+        input_dtype = self.input_details[0]['dtype']
+        img = cv2.resize(image, (self.input_size[1], self.input_size[0]))
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        if input_dtype == np.uint8:
+            img = np.expand_dims(img, axis=0)
+        elif input_dtype == np.int32:
+            img = np.expand_dims(img, axis=0).astype(np.int32)
+        else:
+            img = (np.expand_dims(img, axis=0).astype(np.float32) / 255.0)
+
+        return img
+
+    def infer(self, input_image):
+        start = time.perf_counter()
+        self.interpreter.set_tensor(self.input_details[0]['index'], input_image)
+        self.interpreter.invoke()
+        keypoints = self.interpreter.get_tensor(self.output_details[0]['index'])[0, 0, :, :].copy()
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        return keypoints
+
+class AdaptivePoseBackend:
+    """Ölçülen gecikme bütçeyi aşarsa sıradaki daha hafif modele geçen poz arka ucu"""
+    def __init__(self, order, budget_ms, patience=15, num_threads="auto", delegate="auto", cpu_affinity=None):
+        self.order = list(order)
+        self.budget_ms = budget_ms
+        self.patience = patience  # Geçiş için art arda bütçe aşımı sayısı
+        self.num_threads = num_threads
+        self.delegate = delegate
+        self.cpu_affinity = cpu_affinity
+        self.index = 0
+        self.avg_latency_ms = None
+        self.over_budget = 0
+        # Çevrimdışı sahada önbellekte bulunan ilk model kullanılır
+        self.backend = None
+        for index, name in enumerate(self.order):
+            try:
+                self.backend = self.create_backend(name)
+                self.index = index
+                break
+            except (FileNotFoundError, ValueError) as e:
+                print(e)
+        if self.backend is None:
+            raise FileNotFoundError("Hiçbir poz modeli bulunamadı")
+
+    @classmethod
+    def from_config(cls, config):
+        model = config["pose_model"]
+        order = config["pose_fallback_order"]
+        if model != "auto":
+            # Sabit model seçildiyse yalnızca ondan sonraki modellere düşülebilir
+            order = order[order.index(model):] if model in order else [model]
+        return cls(order, config["pose_latency_budget_ms"], num_threads=config["pose_num_threads"],
+                   delegate=config["pose_delegate"], cpu_affinity=config["pose_cpu_affinity"])
+
+    @property
+    def name(self):
+        return self.backend.name
+
+    @property
+    def input_size(self):
+        return self.backend.input_size
+
+    @property
+    def latency_ms(self):
+        return self.backend.last_latency_ms
+
+    def bind_current_thread(self):
+        """
+        Çağıran iş parçacığını ayarlardaki çekirdeklere bağlar (yalnızca Linux).
+        Önceki çekirdek kümesini döndürür; atama yapılmadıysa None döner.
+        """
+        if self.cpu_affinity and hasattr(os, "sched_setaffinity"):
+            try:
+                previous = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, self.cpu_affinity)
+                return previous
+            except OSError as e:
+                print(f"Çekirdek ataması yapılamadı: {e}")
+        return None
+
+    def create_backend(self, name):
+        """
+        Yorumlayıcıyı çekirdek ataması altında oluşturur. TFLite/XNNPACK işçi iş parçacıkları
+        yorumlayıcıyla birlikte açılır ve çekirdek kümesini onu oluşturan iş parçacığından devralır;
+        ataması sonradan değiştirilen iş parçacığı onları etkilemez.
+        """
+        previous = self.bind_current_thread()
+        try:
+            return PoseBackend(name, self.num_threads, self.delegate)
+        finally:
+            if previous is not None:
+                # Yükleyici iş parçacığı (ör. görüntü yığını yükleyicisi) eski kümesine döner
+                os.sched_setaffinity(0, previous)
+
+    def load(self, name):
+        self.backend = self.create_backend(name)
+        if name in self.order:
+            self.index = self.order.index(name)
+        self.avg_latency_ms = None
+        self.over_budget = 0
+        print(f"Poz modeli: {name}")
+
+    def preprocess(self, image):
+        return self.backend.preprocess(image)
+
+    def infer(self, input_image):
+        keypoints = self.backend.infer(input_image)
+        latency = self.backend.last_latency_ms
+        if self.avg_latency_ms is None:
+            self.avg_latency_ms = latency
+        else:
+            self.avg_latency_ms = 0.9 * self.avg_latency_ms + 0.1 * latency
+        if self.avg_latency_ms > self.budget_ms:
+            self.over_budget += 1
+            if self.over_budget >= self.patience and self.index + 1 < len(self.order):
+                print(f"{self.name} gecikmesi {self.avg_latency_ms:.1f} ms, bütçe {self.budget_ms} ms")
+                try:
+                    self.load(self.order[self.index + 1])
+                except (FileNotFoundError, ValueError) as e:
+                    # Önbellekte olmayan ya da doğrulanamayan model sıradan çıkarılır, bir sonraki aşımda ötekine geçilir
+                    print(e)
+                    del self.order[self.index + 1]
+                    self.over_budget = 0
+        else:
+            self.over_budget = 0
+        return keypoints
+
+class LatestFrameSlot:
+    """Yalnızca en yeni kareyi tutan tek yuvalı tampon; okunmadan ezilen kareler sayılır"""
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.frame = None
+        self.seq = 0
+        self.consumed_seq = 0
+        self.dropped = 0
+
+    def publish(self, frame):
+        with self.condition:
+            if self.seq > self.consumed_seq:
+                self.dropped += 1  # Önceki kare hiç okunmadan eskidi
+            self.frame = frame
+            self.seq += 1
+            self.condition.notify_all()
+
+    def take(self, last_seq, timeout=0.1):
+        """last_seq'ten daha yeni kare gelene kadar bekler; (seq, kare) ya da (last_seq, None) döndürür"""
+        with self.condition:
+            if self.seq <= last_seq:
+                self.condition.wait(timeout)
+            if self.seq <= last_seq:
+                return last_seq, None
+            self.consumed_seq = self.seq
+            return self.seq, self.frame
+
+class FrameGrabber:
+    """Kamerayı ayrı bir iş parçacığında sürekli boşaltır, en yeni kareyi yuvada tutar"""
+    def __init__(self, cap):
+        self.cap = cap
+        self.slot = LatestFrameSlot()
+        self.running = False
+        self.active = threading.Event()  # Temizlendiğinde kareler çözülmeden atılır
+        self.active.set()
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while self.running and self.cap.isOpened():
+            if not self.active.is_set():
+                # Sürücü tamponu taze kalsın ama JPEG çözme maliyeti ödenmesin
+                if not self.cap.grab():
+                    # Kamera çıkarılmış olabilir; gizliyken çekirdeği boşa döndürmesin
+                    time.sleep(0.01)
+                continue
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.01)
+                continue
+            self.slot.publish(frame)
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(1)
+        if self.cap.isOpened():
+            self.cap.release()
+
+class PosePipeline(QObject):
+    """
+    Yakalama -> ön işleme -> çıkarım -> işaretleme aşamalarını GUI dışında çalıştırır.
+    backend None ise (poz modeli yüklenemediyse) çıkarım atlanır ve yalnızca kareler iletilir.
+    """
+    frame_ready = Signal(int, object)  # (kare sıra numarası, gösterim boyutunda BGRA kare)
+
+    def __init__(self, grabber, backend, annotate, frame_size, queue_size=1):
+        super().__init__()
+        self.grabber = grabber
+        self.backend = backend
+        self.annotate = annotate
+        self.frame_size = frame_size  # (genişlik, yükseklik)
+        self.running = False
+        # Aşamalar arası sınırlı kuyruklar; yavaş aşama eski kareleri düşürür
+        self.infer_queue = queue.Queue(maxsize=queue_size)
+        self.annotate_queue = queue.Queue(maxsize=queue_size)
+        self.threads = []
+
+    def start(self):
+        self.running = True
+        self.grabber.start()
+        stages = [self.preprocess_loop, self.annotate_loop]
+        if self.backend is not None:
+            stages.append(self.infer_loop)
+        for stage in stages:
+            thread = threading.Thread(target=stage, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def set_active(self, active):
+        """Görüntü ekranda değilken yakalamayı hafifletir ve çıkarımı durdurur"""
+        if active:
+            self.grabber.active.set()
+        else:
+            self.grabber.active.clear()
+
+    def put_when_ready(self, q, item):
+        """Sonraki aşama boşalana kadar bekler; böylece yuvadan alınan kare hep en yenisidir"""
+        while self.running:
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def next_item(self, q):
+        """Hat durdurulana kadar kuyruktan öğe bekler"""
+        while self.running:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def preprocess_loop(self):
+        last_seq = 0
+        while self.running:
+            if not self.grabber.active.wait(0.1):
+                continue
+            # Her zaman en yeni kareyi al; arada kalanlar yakalayıcıda düşürülür
+            last_seq, frame = self.grabber.slot.take(last_seq)
+            if frame is None:
+                continue
+            # Kare burada bir kez, tam gösterim boyutuna küçültülür; GUI tarafında ölçekleme yapılmaz
+            frame = cv2.resize(frame, self.frame_size)
+            if self.backend is None:
+                self.put_when_ready(self.annotate_queue, (last_seq, frame, None))
+                continue
+            self.put_when_ready(self.infer_queue, (last_seq, frame, self.backend.preprocess(frame)))
+
+    def infer_loop(self):
+        self.backend.bind_current_thread()
+        while self.running:
+            item = self.next_item(self.infer_queue)
+            if item is None:
+                break
+            seq, frame, input_image = item
+            try:
+                if input_image.shape[1:3] != self.backend.input_size:
+                    # Model bu arada değiştiyse girdiyi yeni boyuta göre hazırla
+                    input_image = self.backend.preprocess(frame)
+                keypoints = self.backend.infer(input_image)
+            except Exception as e:
+                print(f"Poz çıkarım hatası: {e}")
+                continue
+            if keypoints is None:
+                continue
+            put_latest(self.annotate_queue, (seq, frame, keypoints))
+
+    def annotate_loop(self):
+        while self.running:
+            item = self.next_item(self.annotate_queue)
+            if item is None:
+                break
+            seq, frame, keypoints = item
+            if keypoints is not None:
+                frame = self.annotate(frame, keypoints)
+            # BGRA bellek düzeni Qt'nin RGB32 biçimiyle aynı; QPixmap'e dönüşümde ek çevirme olmaz
+            self.frame_ready.emit(seq, cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA))
+
+    def stop(self):
+        self.running = False
+        for thread in self.threads:
+            thread.join(1)
+        self.threads = []
+        self.grabber.stop()
+        slot = self.grabber.slot
+        print(f"Kamera hattı durdu: {slot.seq} kare yakalandı, {slot.dropped} kare işlenmeden düştü")
+
+# MoveNet çıktısındaki anahtar nokta sırasıyla vücut parçaları
+BODY_PART_MAPPING = {
+    'nose': 'BURUN', 'left_eye': 'GOZLER', 'right_eye': 'GOZLER',
+    'left_ear': 'KULAK', 'right_ear': 'KULAK',
+    'left_shoulder': 'OMUZ', 'right_shoulder': 'OMUZ',
+    'left_elbow': 'DIRSEK', 'right_elbow': 'DIRSEK',
+    'left_wrist': 'EL', 'right_wrist': 'EL',
+    'left_hip': 'KALCA', 'right_hip': 'KALCA',
+    'left_knee': 'DIZ', 'right_knee': 'DIZ',
+    'left_ankle': 'AYAK', 'right_ankle': 'AYAK'
+}
+BODY_PART_NAMES = list(dict.fromkeys(BODY_PART_MAPPING.values()))
+KEYPOINT_PART_INDEX = np.array([BODY_PART_NAMES.index(part) for part in BODY_PART_MAPPING.values()])
+# reduceat için anahtar noktaları parçalara göre grupla ve her grubun başlangıcını bul
+KEYPOINT_ORDER = np.argsort(KEYPOINT_PART_INDEX, kind="stable")
+PART_STARTS = np.searchsorted(KEYPOINT_PART_INDEX[KEYPOINT_ORDER], np.arange(len(BODY_PART_NAMES)))
+
 class WebcamWidget(QWidget):
+    vision_ready = Signal(object)  # (kamera, poz arka ucu ya da None) ya da kamera yoksa None
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFixedSize(450, 315)
-        self.has_camera = self.check_camera()
+        self.setFixedSize(TILE_SIZE)
+        self.has_camera = False
         self.has_signal = False
         self.signal_strength = 0
+        self.pipeline = None
+        self.active = True
+        self.stopped = False
 
-        if self.has_camera:
-            self.model_path = "movenet_thunder.tflite"
-            if not os.path.exists(self.model_path):
-                url = "https://tfhub.dev/google/lite-model/movenet/singlepose/thunder/tflite/4?lite-format=tflite"
-                urllib.request.urlretrieve(url, self.model_path)
-            self.interpreter = tf.lite.Interpreter(model_path=self.model_path)
-            self.interpreter.allocate_tensors()
-            self.input_details = self.interpreter.get_input_details()
-            self.output_details = self.interpreter.get_output_details()
-            self.BODY_PART_MAPPING = {
-                'nose': 'BURUN', 'left_eye': 'GOZLER', 'right_eye': 'GOZLER',
-                'left_ear': 'KULAK', 'right_ear': 'KULAK',
-                'left_shoulder': 'OMUZ', 'right_shoulder': 'OMUZ',
-                'left_elbow': 'DIRSEK', 'right_elbow': 'DIRSEK',
-                'left_wrist': 'EL', 'right_wrist': 'EL',
-                'left_hip': 'KALCA', 'right_hip': 'KALCA',
-                'left_knee': 'DIZ', 'right_knee': 'DIZ',
-                'left_ankle': 'AYAK', 'right_ankle': 'AYAK'
-            }
-            self.cap = cv2.VideoCapture(0)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_frame)
-            self.timer.start(30)
-        else:
-            # Kamera yoksa SensorTile benzeri görünüm
-            layout = QVBoxLayout(self)
-            layout.setContentsMargins(30, 30, 30, 30)
-            layout.setAlignment(Qt.AlignCenter)
-            
-            self.signal_indicator = SignalStrengthIndicator()
-            self.signal_indicator.setFixedSize(40, 40)
-            layout.addWidget(self.signal_indicator, 0, Qt.AlignCenter)
-            
-            self.title_label = QLabel("WEBCAM")
-            self.title_label.setAlignment(Qt.AlignCenter)
-            self.title_label.setStyleSheet("color: #AAAAAA; font-size: 24px; font-weight: bold;")
-            layout.addWidget(self.title_label)
-            
-            self.status_label = QLabel("NO SIGNAL")
-            self.status_label.setAlignment(Qt.AlignCenter)
-            self.status_label.setStyleSheet("color: #888888; font-size: 21px;")
-            layout.addWidget(self.status_label)
+        # Kamera ve model arka planda yüklenirken SensorTile benzeri görünüm
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setAlignment(Qt.AlignCenter)
+        
+        self.signal_indicator = SignalStrengthIndicator()
+        self.signal_indicator.setFixedSize(40, 40)
+        layout.addWidget(self.signal_indicator, 0, Qt.AlignCenter)
+        
+        self.title_label = QLabel("WEBCAM")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        self.title_label.setStyleSheet("color: #AAAAAA; font-size: 24px; font-weight: bold;")
+        layout.addWidget(self.title_label)
+        
+        self.status_label = QLabel("STARTING...")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: #888888; font-size: 21px;")
+        layout.addWidget(self.status_label)
 
         self.current_frame = None
+        self.frame_seq = 0
+        self.pixmap_seq = -1
+        self.cached_pixmap = None
 
-    def check_camera(self):
+        # OpenCV, kamera yoklaması ve model yükleme saniyeler sürebilir; pencere beklemeden açılır
+        self.vision_ready.connect(self.on_vision_ready)
+        threading.Thread(target=self.load_vision, daemon=True).start()
+
+    def open_camera(self):
+        """Kamerayı açar; yoksa None döndürür"""
         cap = cv2.VideoCapture(0)
         if cap is None or not cap.isOpened():
             if cap is not None:
                 cap.release()
-            return False
-        cap.release()
-        return True
+            return None
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Sürücü tamponunda eski kare birikmesin
+        return cap
 
-    def process_image(self, image):
-        input_shape = self.input_details[0]['shape'][1:3]
-        input_dtype = self.input_details[0]['dtype']
-        img = cv2.resize(image, (input_shape[1], input_shape[0]))
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        if input_dtype == np.uint8:
-            img = np.expand_dims(img, axis=0)
-        else:
-            img = (np.expand_dims(img, axis=0).astype(np.float32) / 255.0)
-        
-        return img
+    def load_vision(self):
+        """Görüntü yığınını arka planda yükler; sonucu vision_ready ile GUI iş parçacığına iletir"""
+        try:
+            load_vision_stack()
+            cap = self.open_camera()
+            mark_startup("kamera yoklaması")
+        except Exception as e:
+            print(f"Görüntü yığını yüklenemedi: {e}")
+            cap = None
+        if cap is None:
+            self.vision_ready.emit(None)
+            return
+        try:
+            backend = AdaptivePoseBackend.from_config(CONFIG)
+        except Exception as e:
+            # Model yoksa kamera görüntüsü yine gösterilir; hata karoda ayrıca belirtilir
+            print(f"Poz modeli yüklenemedi, yalnızca görüntü gösterilecek: {e}")
+            backend = None
+        mark_startup("poz modeli")
+        self.vision_ready.emit((cap, backend))
+
+    @Slot(object)
+    def on_vision_ready(self, result):
+        if result is None:
+            self.status_label.setText("NO SIGNAL")
+            mark_startup("kamera karosu")
+            return
+        cap, backend = result
+        if self.stopped:
+            cap.release()
+            return
+        self.has_camera = True
+        self.backend = backend
+        self.cap = cap
+        for widget in (self.signal_indicator, self.title_label, self.status_label):
+            widget.hide()
+        self.grabber = FrameGrabber(self.cap)
+        # Yakalama, çıkarım ve çizim GUI iş parçacığını bloklamasın diye ayrı hatta çalışır
+        self.pipeline = PosePipeline(
+            self.grabber, self.backend, self.draw_bounding_boxes, (self.width(), self.height())
+        )
+        self.pipeline.frame_ready.connect(self.on_frame_ready)
+        self.pipeline.start()
+        self.pipeline.set_active(self.active)
+        # Sensör görüntüsü: yük altında yavaşlatılmaz
+        self.frame_task = frame_scheduler().add(self.present_frame, 0, FrameScheduler.CRITICAL)
+        self.update()
+        mark_startup("kamera karosu")
 
     def create_body_part_bounding_boxes(self, keypoints, confidence_threshold=0.3):
-        body_parts = {}
-        valid_keypoints = {}
-        
-        for idx, (y, x, confidence) in enumerate(keypoints):
-            if confidence > confidence_threshold:
-                keypoint_name = list(self.BODY_PART_MAPPING.keys())[idx % len(self.BODY_PART_MAPPING)]
-                body_part = self.BODY_PART_MAPPING[keypoint_name]
-                
-                if body_part not in valid_keypoints:
-                    valid_keypoints[body_part] = []
-                valid_keypoints[body_part].append((y, x))
-        bounding_boxes = {}
+        """Kutuları (parça indeksi, y_min, x_min, y_max, x_max) satırlarından oluşan dizi olarak döndürür"""
+        points = keypoints[KEYPOINT_ORDER]
+        valid = (points[:, 2] > confidence_threshold)[:, None]
+        # min ve max tek geçişte: [y, x, -y, -x] sütunlarının grup minimumu
+        y_x = points[:, :2]
+        extremes = np.minimum.reduceat(
+            np.where(valid, np.hstack((y_x, -y_x)), np.inf),  # Güvenilmeyen noktalar etkisiz kalır
+            PART_STARTS, axis=0
+        )
+        mins, maxs = extremes[:, :2], -extremes[:, 2:]
+        found = np.isfinite(mins[:, 0])
         padding = 0.05
-        for part, points in valid_keypoints.items():
-            if points:
-                y_coords = [p[0] for p in points]
-                x_coords = [p[1] for p in points]
-                
-                y_min = max(0, min(y_coords) - padding)
-                x_min = max(0, min(x_coords) - padding)
-                y_max = min(1, max(y_coords) + padding)
-                x_max = min(1, max(x_coords) + padding)
-                
-                bounding_boxes[part] = (y_min, x_min, y_max, x_max)
-        
+        bounding_boxes = np.empty((np.count_nonzero(found), 5), dtype=np.float32)
+        bounding_boxes[:, 0] = np.flatnonzero(found)
+        bounding_boxes[:, 1:3] = np.clip(mins[found] - padding, 0, 1)
+        bounding_boxes[:, 3:5] = np.clip(maxs[found] + padding, 0, 1)
+
         return bounding_boxes
 
     def draw_bounding_boxes(self, image, keypoints):
@@ -648,11 +1710,12 @@ class WebcamWidget(QWidget):
         bounding_boxes = self.create_body_part_bounding_boxes(keypoints)
         box_color = (200, 200, 200)  # Beyaz
         
-        for part, (y_min, x_min, y_max, x_max) in bounding_boxes.items():
-            x_min_px, y_min_px = int(x_min * w), int(y_min * h)
-            x_max_px, y_max_px = int(x_max * w), int(y_max * h)
+        part_indices = bounding_boxes[:, 0].astype(np.int32).tolist()
+        pixel_boxes = (bounding_boxes[:, 1:] * (h, w, h, w)).astype(np.int32).tolist()
+
+        for part_index, (y_min_px, x_min_px, y_max_px, x_max_px) in zip(part_indices, pixel_boxes):
             cv2.rectangle(image, (x_min_px, y_min_px), (x_max_px, y_max_px), box_color, 1)  # İnce çerçeve
-            text = part
+            text = BODY_PART_NAMES[part_index]
             font_scale = 0.4  # Yazı boyutunu küçült (0.7'den 0.4'e)
             thickness = 1     # Yazı kalınlığını azalt (2'den 1'e)
             text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
@@ -670,17 +1733,25 @@ class WebcamWidget(QWidget):
         
         return image
 
-    def update_frame(self):
-        if self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.resize(frame, (self.width(), self.height()))
-                input_image = self.process_image(frame)
-                self.interpreter.set_tensor(self.input_details[0]['index'], input_image)
-                self.interpreter.invoke()
-                keypoints = self.interpreter.get_tensor(self.output_details[0]['index'])[0, 0, :, :]
-                self.current_frame = self.draw_bounding_boxes(frame, keypoints)
-                self.update()
+    @Slot(int, object)
+    def on_frame_ready(self, seq, frame):
+        """İşlem hattından gelen hazır kareyi saklar; çizimi ortak saat tetikler"""
+        self.current_frame = frame
+        self.frame_seq = seq
+
+    def present_frame(self):
+        if self.frame_seq != self.pixmap_seq:
+            self.update()
+
+    def current_pixmap(self):
+        """Güncel kareyi sıra numarasına göre önbelleklenmiş QPixmap olarak döndürür"""
+        if self.pixmap_seq != self.frame_seq:
+            h, w, _ = self.current_frame.shape
+            # QImage numpy tamponunu kopyalamadan sarar; tek dönüşüm QPixmap.fromImage'da
+            image = QImage(self.current_frame.data, w, h, self.current_frame.strides[0], QImage.Format_RGB32)
+            self.cached_pixmap = QPixmap.fromImage(image)
+            self.pixmap_seq = self.frame_seq
+        return self.cached_pixmap
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -698,51 +1769,524 @@ class WebcamWidget(QWidget):
         # Kamera varsa normal görüntüleme
         painter.setClipPath(path)
         if self.current_frame is not None:
-            h, w, ch = self.current_frame.shape
-            bytes_per_line = ch * w
-            image = QImage(self.current_frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
-            pixmap = QPixmap.fromImage(image)
-            scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            x = (self.width() - scaled_pixmap.width()) // 2
-            y = (self.height() - scaled_pixmap.height()) // 2
-            painter.drawPixmap(x, y, scaled_pixmap)
+            pixmap = self.current_pixmap()
+            x = (self.width() - pixmap.width()) // 2
+            y = (self.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+            # Etkin model, son çıkarım süresi ve işlenmeden düşen kare sayısı; model yüklenemediyse
+            # bu ayrıca belirtilir
+            painter.setFont(QFont("Arial", 9))
+            if self.backend is None:
+                painter.setPen(QColor(255, 170, 90))
+                overlay = "NO POSE MODEL"
+            else:
+                painter.setPen(QColor(200, 200, 200))
+                overlay = f"{self.backend.name.upper()} {self.backend.latency_ms:.1f} ms"
+            overlay += f"  DROP {self.grabber.slot.dropped}"
+            painter.drawText(QRect(0, 12, self.width() - 30, 20), Qt.AlignRight, overlay)
         painter.setPen(QPen(QColor(50, 50, 50, 150), 2))
         painter.drawPath(path)
 
+    def stop(self):
+        """İşlem hattını durdurur ve kamerayı serbest bırakır"""
+        self.stopped = True
+        if self.pipeline is not None:
+            self.pipeline.stop()
+
+    def set_active(self, active):
+        """Karo ya da pencere görünmezken poz çıkarımını askıya alır"""
+        self.active = active
+        if self.pipeline is not None:
+            self.pipeline.set_active(active)
+
     def closeEvent(self, event):
-        if self.cap.isOpened():
-            self.cap.release()
+        self.stop()
         super().closeEvent(event)
 
+class HttpService(QObject):
+    """
+    Tüm ağ isteklerini tek bir asyncio olay döngüsü iş parçacığından yürüten ortak HTTP servisi.
+    Sunucu başına bağlantı havuzu, aynı URL'ye süren isteklerin birleştirilmesi, genel eşzamanlılık
+    sınırı ve gecikme ölçümleri burada tutulur. Yanıtlar Qt'ye finished sinyaliyle iletilir.
+    """
+    finished = Signal(int, object, object)  # (istek numarası, yanıt ya da işlenmiş sonuç, hata ya da None)
+
+    def __init__(self, max_concurrency=8, connections_per_host=4, timeout=5):
+        super().__init__()
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.sessions = {}  # sunucu -> requests.Session
+        self.sessions_lock = threading.Lock()
+        self.in_flight = {}  # URL -> asyncio.Future; yalnızca olay döngüsünde erişilir
+        self.metrics = {}  # sunucu -> istek, birleştirilen, hata ve gecikme sayaçları
+        self.request_ids = itertools.count(1)
+        # Bağlantı kütüphanesi engelleyici olduğundan G/Ç sınırlı bir iş parçacığı havuzunda yapılır
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        # Python 3.10 öncesinde Semaphore oluşturulduğu iş parçacığının döngüsüne bağlanır
+        self.semaphore = asyncio.run_coroutine_threadsafe(self.create_semaphore(max_concurrency), self.loop).result()
+
+    @staticmethod
+    async def create_semaphore(value):
+        return asyncio.Semaphore(value)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config["http_max_concurrency"], config["http_connections_per_host"], config["http_timeout_s"])
+
+    def session_for(self, url):
+        """Sunucu başına tek kalıcı (keep-alive) oturum döndürür"""
+        host = urlparse(url).netloc
+        with self.sessions_lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.connections_per_host)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.sessions[host] = session
+            return session
+
+    def host_metrics(self, url):
+        host = urlparse(url).netloc
+        if host not in self.metrics:
+            self.metrics[host] = {"requests": 0, "coalesced": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+        return self.metrics[host]
+
+    def get(self, url, timeout):
+        return self.session_for(url).get(url, timeout=timeout or self.timeout)
+
+    async def fetch(self, url, timeout=None):
+        """(yanıt, hata) döndürür; aynı URL için süren bir istek varsa yenisi açılmaz, onun sonucu beklenir"""
+        metrics = self.host_metrics(url)
+        pending = self.in_flight.get(url)
+        if pending is not None:
+            metrics["coalesced"] += 1
+            return await asyncio.shield(pending)
+        pending = self.loop.create_future()
+        self.in_flight[url] = pending
+        # İstek iptal edilir ya da beklenmedik biçimde biterse birleştirilen bekleyenler askıda kalmasın
+        result = (None, ConnectionError(f"istek tamamlanamadı: {url}"))
+        try:
+            async with self.semaphore:
+                start = time.perf_counter()
+                try:
+                    result = (await self.loop.run_in_executor(self.executor, self.get, url, timeout), None)
+                except Exception as e:
+                    result = (None, e)
+                    metrics["errors"] += 1
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            metrics["requests"] += 1
+            metrics["total_ms"] += elapsed_ms
+            metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
+            return result
+        finally:
+            del self.in_flight[url]
+            if not pending.done():
+                pending.set_result(result)
+
+    def request(self, url, timeout=None, process=None):
+        """
+        GUI'den engellemeden istek gönderir; sonuç finished sinyaliyle bu numarayla gelir.
+        process verilirse başarılı yanıt GUI'ye ulaşmadan havuzda process(yanıt) ile işlenir
+        (ayrıştırma, diske yazma) ve sinyalde yanıtın yerine dönüş değeri taşınır.
+        """
+        request_id = next(self.request_ids)
+
+        async def run():
+            response, error = await self.fetch(url, timeout)
+            if process is not None and error is None:
+                try:
+                    response = await self.loop.run_in_executor(self.executor, process, response)
+                except Exception as e:
+                    response, error = None, e
+            self.finished.emit(request_id, response, error)
+
+        asyncio.run_coroutine_threadsafe(run(), self.loop)
+        return request_id
+
+    def fetch_blocking(self, url, timeout=None):
+        """Arka plan iş parçacıkları için: isteği servis üzerinden yapar ve (yanıt, hata) döndürür"""
+        return asyncio.run_coroutine_threadsafe(self.fetch(url, timeout), self.loop).result()
+
+    def metrics_snapshot(self):
+        """Sunucu başına ölçümlerin ortalama gecikme eklenmiş kopyası"""
+        snapshot = {}
+        for host, metrics in list(self.metrics.items()):
+            entry = dict(metrics)
+            entry["avg_ms"] = entry["total_ms"] / entry["requests"] if entry["requests"] else 0.0
+            snapshot[host] = entry
+        return snapshot
+
+    def stop(self):
+        for host, metrics in self.metrics_snapshot().items():
+            print(f"HTTP {host}: {metrics['requests']} istek, {metrics['coalesced']} birleştirildi, "
+                  f"{metrics['errors']} hata, ort. {metrics['avg_ms']:.1f} ms, en çok {metrics['max_ms']:.1f} ms")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.executor.shutdown(wait=False)
+        with self.sessions_lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+_http_service = None
+
+def http_service():
+    """Uygulama genelindeki tek HttpService örneğini döndürür"""
+    global _http_service
+    if _http_service is None:
+        _http_service = HttpService.from_config(CONFIG)
+    return _http_service
+
+class Esp32CamClient:
+    """ESP32-CAM'den JPEG kareleri alır; /stream MJPEG akışını ve tekil /capture isteklerini destekler"""
+    def __init__(self, url, timeout=2):
+        self.url = url
+        self.timeout = timeout
+        # Ortak servisin bu sunucuya ait kalıcı oturumu; her kare için yeni TCP bağlantısı açılmaz
+        self.session = http_service().session_for(url)
+        self.stream_mode = urlparse(url).path.rstrip("/").endswith("stream")
+        self.stream_response = None
+        self.stream_chunks = None
+        self.stream_buffer = bytearray()
+
+    def next_frame(self):
+        """Sıradaki JPEG baytlarını döndürür; bağlantı sorununda istisna fırlatır"""
+        if self.stream_mode:
+            return self.read_stream_frame()
+        response, error = http_service().fetch_blocking(self.url, self.timeout)
+        if error is not None:
+            raise error
+        if response.status_code != 200:
+            raise Exception(f"ESP32-CAM bağlantı hatası ({response.status_code})")
+        return response.content
+
+    def open_stream(self):
+        # Uzun ömürlü MJPEG akışı servisin eşzamanlılık sınırına sayılmaz, yalnızca oturumu paylaşır
+        response = self.session.get(self.url, stream=True, timeout=self.timeout)
+        if response.status_code != 200:
+            response.close()
+            raise Exception(f"ESP32-CAM bağlantı hatası ({response.status_code})")
+        self.stream_response = response
+        self.stream_chunks = response.iter_content(chunk_size=4096)
+        self.stream_buffer.clear()
+
+    def read_stream_frame(self):
+        if self.stream_response is None:
+            self.open_stream()
+        try:
+            while True:
+                jpeg = self.extract_stream_frame()
+                if jpeg is not None:
+                    return jpeg
+                self.stream_buffer.extend(next(self.stream_chunks))
+        except StopIteration:
+            self.close_stream()
+            raise Exception("ESP32-CAM akışı kapandı")
+        except Exception:
+            self.close_stream()
+            raise
+
+    def extract_stream_frame(self):
+        """Tampondaki ilk tam multipart parçasını keser; yoksa None döndürür"""
+        buffer = self.stream_buffer
+        header_end = buffer.find(b"\r\n\r\n")
+        if header_end == -1:
+            return None
+        match = re.search(rb"content-length:\s*(\d+)", buffer[:header_end], re.IGNORECASE)
+        if match:
+            start = header_end + 4
+            end = start + int(match.group(1))
+            if len(buffer) < end:
+                return None
+        else:
+            # Content-Length yoksa JPEG başlangıç/bitiş işaretlerine göre kes
+            start = buffer.find(b"\xff\xd8", header_end)
+            end = buffer.find(b"\xff\xd9", start + 2) if start != -1 else -1
+            if end == -1:
+                return None
+            end += 2
+        jpeg = bytes(buffer[start:end])
+        del buffer[:end]
+        return jpeg
+
+    def close_stream(self):
+        if self.stream_response is not None:
+            self.stream_response.close()
+        self.stream_response = None
+        self.stream_chunks = None
+
+    def close(self):
+        self.close_stream()  # Oturum ortak servise aittir, burada kapatılmaz
+
+class CircuitBreaker:
+    """Bağlantı durum makinesi: connected -> degraded -> open, rastgele sapmalı üstel geri çekilmeyle"""
+    CONNECTED = "connected"
+    DEGRADED = "degraded"
+    OPEN = "open"
+    HALF_OPEN = "half_open"  # Açık devrede tek deneme isteği
+
+    def __init__(self, failure_threshold=3, retry_delay=0.5, base_delay=1.0, max_delay=60.0, jitter=0.5):
+        self.failure_threshold = failure_threshold  # Devrenin açılması için art arda hata sayısı
+        self.retry_delay = retry_delay  # degraded durumunda denemeler arası bekleme
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.state = self.CONNECTED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.next_attempt_at = 0.0
+        self.down_since = None
+        self.metrics = {
+            "attempts": 0, "successes": 0, "failures": 0, "circuit_opens": 0,
+            "recoveries": 0, "last_recovery_s": None, "total_recovery_s": 0.0,
+        }
+
+    def seconds_until_attempt(self):
+        return max(0.0, self.next_attempt_at - time.monotonic())
+
+    def begin_attempt(self):
+        self.metrics["attempts"] += 1
+        if self.state == self.OPEN:
+            self.state = self.HALF_OPEN
+
+    def record_success(self):
+        self.metrics["successes"] += 1
+        if self.down_since is not None:
+            recovery = time.monotonic() - self.down_since
+            self.metrics["recoveries"] += 1
+            self.metrics["last_recovery_s"] = recovery
+            self.metrics["total_recovery_s"] += recovery
+            self.down_since = None
+        self.state = self.CONNECTED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.next_attempt_at = 0.0
+
+    def record_failure(self):
+        now = time.monotonic()
+        self.metrics["failures"] += 1
+        self.consecutive_failures += 1
+        if self.down_since is None:
+            self.down_since = now
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            # Her açılışta bekleme ikiye katlanır; eş zamanlı yeniden bağlanma fırtınasını önlemek için sapma eklenir
+            delay = min(self.max_delay, self.base_delay * (2 ** self.open_count))
+            delay *= random.uniform(1 - self.jitter, 1)
+            self.open_count += 1
+            self.metrics["circuit_opens"] += 1
+            self.state = self.OPEN
+        else:
+            delay = self.retry_delay
+            self.state = self.DEGRADED
+        self.next_attempt_at = now + delay
+
+class CameraFleet(QObject):
+    """Tüm ESP32-CAM'leri eşzamanlılık ve bant genişliği sınırlı ortak bir çekme havuzuyla yönetir"""
+    frame_ready = Signal(int, QImage)  # (kamera indeksi, karo boyutunda kare)
+    state_changed = Signal(int, str)  # (kamera indeksi, CircuitBreaker durumu)
+
+    def __init__(self, cameras, frame_size, concurrency=4, bandwidth_limit_kbps=0,
+                 poll_interval=0.1, idle_interval=5.0):
+        super().__init__()
+        self.cameras = cameras
+        self.frame_size = frame_size
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self.clients = [Esp32CamClient(camera["url"]) for camera in cameras]
+        self.breakers = [CircuitBreaker() for _ in cameras]
+        self.visible = set(range(len(cameras)))
+        # (zaman, kamera, sürüm) öğelerinden oluşan zamanlama kuyruğu; eski sürümlü öğeler atlanır
+        self.schedule = [(0.0, index, 0) for index in range(len(cameras))]
+        self.versions = [0] * len(cameras)
+        self.in_flight = set()
+        self.condition = threading.Condition()
+        # Bayt cinsinden jeton kovası
+        self.bandwidth = bandwidth_limit_kbps * 1000 / 8
+        self.tokens = self.bandwidth
+        self.tokens_updated = time.monotonic()
+        self.bandwidth_lock = threading.Lock()
+        self.running = False
+        self.threads = []
+
+    @classmethod
+    def from_config(cls, config, frame_size):
+        return cls(
+            config["esp32_cameras"], frame_size,
+            concurrency=config["camera_fetch_concurrency"],
+            bandwidth_limit_kbps=config["camera_bandwidth_limit_kbps"],
+            poll_interval=config["camera_poll_interval_ms"] / 1000,
+            idle_interval=config["camera_idle_interval_ms"] / 1000,
+        )
+
+    def start(self):
+        self.running = True
+        for _ in range(min(self.concurrency, len(self.cameras))):
+            thread = threading.Thread(target=self.worker_loop, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def set_visible(self, indices):
+        """Ekrandaki kameraları bildirir; yeni görünenler hemen sıraya alınır"""
+        indices = set(indices)
+        with self.condition:
+            newly_visible = indices - self.visible
+            self.visible = indices
+            for index in newly_visible:
+                if index not in self.in_flight:
+                    self.push(index, 0.0)
+            self.condition.notify_all()
+
+    def push(self, index, delay):
+        self.versions[index] += 1
+        heapq.heappush(self.schedule, (time.monotonic() + delay, index, self.versions[index]))
+
+    def next_job(self):
+        with self.condition:
+            while self.running:
+                if not self.schedule:
+                    self.condition.wait(0.1)
+                    continue
+                due, index, version = self.schedule[0]
+                if version != self.versions[index]:
+                    heapq.heappop(self.schedule)
+                    continue
+                wait = due - time.monotonic()
+                if wait <= 0:
+                    heapq.heappop(self.schedule)
+                    self.in_flight.add(index)
+                    return index
+                self.condition.wait(min(wait, 0.1))
+        return None
+
+    def finish_job(self, index, delay):
+        with self.condition:
+            self.in_flight.discard(index)
+            self.push(index, delay)
+            self.condition.notify()
+
+    def throttle(self, size):
+        """Toplam bant genişliği sınırı aşılıyorsa bu işçiyi gereken süre kadar bekletir"""
+        if not self.bandwidth:
+            return
+        with self.bandwidth_lock:
+            now = time.monotonic()
+            self.tokens = min(self.bandwidth, self.tokens + (now - self.tokens_updated) * self.bandwidth)
+            self.tokens_updated = now
+            self.tokens -= size
+            deficit = -self.tokens
+        if deficit > 0:
+            time.sleep(deficit / self.bandwidth)
+
+    def worker_loop(self):
+        while self.running:
+            index = self.next_job()
+            if index is None:
+                break
+            self.finish_job(index, self.fetch(index))
+
+    def fetch(self, index):
+        """Kameradan bir kare çeker ve bir sonraki denemeye kadar beklenecek süreyi döndürür"""
+        client = self.clients[index]
+        breaker = self.breakers[index]
+        with self.condition:
+            visible = index in self.visible
+        previous_state = breaker.state
+        started = time.monotonic()
+        breaker.begin_attempt()
+        try:
+            data = client.next_frame()
+            self.throttle(len(data))
+            image = self.decode(data) if visible else None
+        except Exception as e:
+            breaker.record_failure()
+            if breaker.state != previous_state:
+                print(f"ESP32-CAM Hatası [{self.cameras[index]['title']}] ({breaker.state}): {e}")
+        else:
+            breaker.record_success()
+            if image is not None:
+                self.frame_ready.emit(index, image)
+            recovery = breaker.metrics["last_recovery_s"]
+            if previous_state != CircuitBreaker.CONNECTED and recovery is not None:
+                print(f"ESP32-CAM yeniden bağlandı [{self.cameras[index]['title']}] ({recovery:.1f} s)")
+        if breaker.state != previous_state:
+            self.state_changed.emit(index, breaker.state)
+
+        if breaker.state != CircuitBreaker.CONNECTED:
+            return breaker.seconds_until_attempt()
+        if not visible:
+            client.close_stream()  # Görünmeyen kamera için akış açık tutulmaz
+            return self.idle_interval
+        if client.stream_mode:
+            return 0.0
+        return max(0.0, self.poll_interval - (time.monotonic() - started))
+
+    def decode(self, data):
+        """JPEG'i çözer ve karo boyutuna bir kez ölçekler"""
+        image = QImage()
+        if not image.loadFromData(data, "JPG"):
+            raise Exception("Geçersiz JPEG verisi")
+        return image.scaled(self.frame_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        for client in self.clients:
+            client.close()
+        for thread in self.threads:
+            thread.join(1)
+        self.threads = []
+
 class ESP32CamTile(SensorTile):
     def __init__(self, title, esp32_url, parent=None):
         super().__init__(title, parent)
-        self.esp32_url = esp32_url  # ESP32-CAM'in URL'si
+        frame_scheduler().remove(self.signal_task)  # Sinyal durumu rastgele değil, gerçek bağlantıdan gelir
+        self.esp32_url = esp32_url  # ESP32-CAM'in URL'si (/stream ya da /capture)
         self.current_frame = None  # ESP32-CAM'den alınan son kareyi saklamak için
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(100)  # 100 ms'de bir kare güncelle
+        self.frame_pending = False
+        self.on_connection_state(CircuitBreaker.OPEN)  # İlk kare gelene kadar sinyal yok
+        # Sensör görüntüsü: yük altında yavaşlatılmaz
+        self.frame_task = frame_scheduler().add(self.present_frame, 0, FrameScheduler.CRITICAL)
 
-    def update_frame(self):
-        try:
-            response = requests.get(self.esp32_url, timeout=2)
-            if response.status_code == 200:
-                image_data = response.content
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-                self.current_frame = pixmap
-                self.has_signal = True
-                self.status_label.setText("SIGNAL OK")
-                self.status_label.setStyleSheet("color: #88FF88; font-size: 21px;")
-            else:
-                raise Exception("ESP32-CAM bağlantı hatası")
-        except Exception as e:
-            self.current_frame = None
+    @Slot(QImage)
+    def on_frame_ready(self, image):
+        self.current_frame = QPixmap.fromImage(image)
+        self.frame_pending = True  # paintEvent'i ortak saat tetikler
+        if not self.has_signal:
+            self.on_connection_state(CircuitBreaker.CONNECTED)
+
+    def present_frame(self):
+        """Yeni kare geldiyse ortak saatin tikinde yeniden çizer"""
+        if self.frame_pending:
+            self.frame_pending = False
+            self.update()
+
+    @Slot(str)
+    def on_connection_state(self, state):
+        """Bağlantı durumunu sinyal göstergesine ve etiketlere yansıtır"""
+        if state == CircuitBreaker.CONNECTED:
+            self.has_signal = True
+            self.signal_strength = 3
+            self.status_label.setText("SIGNAL OK")
+            self.status_label.setStyleSheet("color: #88FF88; font-size: 21px;")
+        elif state == CircuitBreaker.DEGRADED:
+            # Ara sıra hata var ama devre henüz açılmadı; son kare gösterilmeye devam eder
+            self.has_signal = True
+            self.signal_strength = 1
+            self.status_label.setText("SIGNAL OK")
+            self.status_label.setStyleSheet("color: #FFDD88; font-size: 21px;")
+        else:
             self.has_signal = False
+            self.signal_strength = 0
+            self.current_frame = None
             self.status_label.setText("NO SIGNAL")
             self.status_label.setStyleSheet("color: #FF8888; font-size: 21px;")
-            print(f"ESP32-CAM Hatası: {e}")
-        self.update()  # paintEvent'i tetikle
+        self.signal_indicator.set_signal_level(self.signal_strength)
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -754,33 +2298,159 @@ class ESP32CamTile(SensorTile):
             clip_path = QPainterPath()
             clip_path.addRoundedRect(self.rect(), 30, 30)
             painter.setClipPath(clip_path)
-            scaled_pixmap = self.current_frame.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            painter.drawPixmap(self.rect(), scaled_pixmap)
+            # Kare arka planda karo boyutuna ölçeklendi; burada yalnızca ortalanır
+            x = (self.width() - self.current_frame.width()) // 2
+            y = (self.height() - self.current_frame.height()) // 2
+            painter.drawPixmap(x, y, self.current_frame)
         painter.setPen(QPen(QColor(50, 50, 50, 150), 2))
         painter.drawPath(path)
 
+WEATHER_CACHE_PATH = Path(__file__).parent / "weather_cache.json"
+
+def load_weather_cache():
+    """Son başarılı hava durumu yanıtını ve alınma zamanını döndürür"""
+    try:
+        with open(WEATHER_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache["data"], cache["fetched_at"]
+    except (OSError, ValueError, KeyError):
+        return None, 0
+
+WEATHER_ICON_FILES = ("sunny", "partly_cloudy", "cloudy", "rainy", "snowy", "stormy")
+DEFAULT_WEATHER_ICON = "partly_cloudy"
+# wttr.in (WorldWeatherOnline) hava durumu kodu -> ikon
+WEATHER_CODE_ICONS = {str(code): icon for icon, codes in {
+    "sunny": (113,),
+    "partly_cloudy": (116,),
+    "cloudy": (119, 122, 143, 248, 260),
+    "rainy": (176, 185, 263, 266, 281, 284, 293, 296, 299, 302, 305, 308, 311, 314, 353, 356, 359),
+    "snowy": (179, 182, 227, 230, 317, 320, 323, 326, 329, 332, 335, 338, 350,
+              362, 365, 368, 371, 374, 377),
+    "stormy": (200, 386, 389, 392, 395),
+}.items() for code in codes}
+# Kod gelmezse küçük harfe çevrilmiş açıklama doğrudan aranır
+WEATHER_DESC_ICONS = {
+    "sunny": "sunny", "clear": "sunny", "partly cloudy": "partly_cloudy",
+    "cloudy": "cloudy", "overcast": "cloudy", "mist": "cloudy",
+    "patchy rain possible": "rainy", "light rain": "rainy", "moderate rain": "rainy", "heavy rain": "rainy",
+    "light snow": "snowy", "moderate snow": "snowy", "heavy snow": "snowy",
+    "thunderstorm": "stormy", "thunder": "stormy",
+}
+WEATHER_ICONS_DIR = Path(__file__).parent / "icons"
+weather_icon_sources = None
+weather_icon_cache = {}
+
+def weather_icon_name(code, description):
+    return (WEATHER_CODE_ICONS.get(str(code).strip())
+            or WEATHER_DESC_ICONS.get(description.strip().lower(), DEFAULT_WEATHER_ICON))
+
+def find_resource_icons():
+    """resources_rc içindeki hava durumu ikonlarını önekten bağımsız olarak dosya adından bulur"""
+    paths = {}
+    iterator = QDirIterator(":/", QDirIterator.Subdirectories)
+    while iterator.hasNext():
+        path = iterator.next()
+        stem, _, extension = path.rsplit("/", 1)[-1].rpartition(".")
+        if extension == "png" and stem in WEATHER_ICON_FILES:
+            paths.setdefault(stem, path)
+    return paths
+
+def weather_icons(size):
+    """Hava durumu ikonlarını bir kez çözer; her boyut için ölçeklenmiş kopyaları önbellekte tutar"""
+    global weather_icon_sources
+    if weather_icon_sources is None:
+        paths = find_resource_icons()
+        weather_icon_sources = {}
+        for icon in WEATHER_ICON_FILES:
+            # Kaynak paketi eskiyse icons klasörü yedek olarak kullanılır
+            pixmap = QPixmap(paths.get(icon, str(WEATHER_ICONS_DIR / f"{icon}.png")))
+            if pixmap.isNull():
+                print(f"Ikon yüklenemedi: {icon}")
+                continue
+            weather_icon_sources[icon] = pixmap
+    if size not in weather_icon_cache:
+        weather_icon_cache[size] = {
+            icon: pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            for icon, pixmap in weather_icon_sources.items()
+        }
+    return weather_icon_cache[size]
+
+def save_weather_cache(data):
+    try:
+        temp_path = WEATHER_CACHE_PATH.with_suffix(".part")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "data": data}, f)
+        os.replace(temp_path, WEATHER_CACHE_PATH)
+    except OSError as e:
+        print(f"Hava durumu önbelleği yazılamadı: {e}")
+
+class WeatherProvider(QObject):
+    """Hava durumu verisini kendi takviminde arka planda alır, önbelleğe yazar ve yayınlar"""
+    weather_changed = Signal(object)  # Gösterilecek veri; yoksa ya da çok eskiyse None
+
+    def __init__(self, city=CONFIG["weather_city"]):
+        super().__init__()
+        self.city = city
+        self.request_id = None  # Süren isteğin numarası
+        self.first_fetch_done = False
+        self.data, self.fetched_at = load_weather_cache()
+        http_service().finished.connect(self.on_response)
+        refresh_ms = CONFIG["weather_refresh_interval_s"] * 1000
+        self.task = frame_scheduler().add(self.refresh, refresh_ms)  # Her 5 dakikada bir güncelle
+
+    def start(self):
+        """Son bilinen hava durumunu hemen yayınlar; eskiyse arka planda yeniler"""
+        if self.data is not None and not self.expired():
+            self.weather_changed.emit(self.data)
+        if time.time() - self.fetched_at >= CONFIG["weather_refresh_interval_s"]:
+            self.refresh()
+
+    def expired(self):
+        return time.time() - self.fetched_at >= CONFIG["weather_cache_max_age_s"]
+
+    def refresh(self):
+        """İsteği ortak HTTP servisine gönderir; önceki istek sürüyorsa yenisini açmaz"""
+        if self.request_id is not None:
+            return
+        self.request_id = http_service().request(CONFIG["weather_url"].format(city=self.city),
+                                                 process=self.parse_response)
+
+    @staticmethod
+    def parse_response(response):
+        """HTTP servisinin iş parçacığında çalışır: JSON'u ayrıştırır ve önbelleğe yazar"""
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        data = response.json()
+        save_weather_cache(data)
+        return data
+
+    @Slot(int, object, object)
+    def on_response(self, request_id, data, error):
+        if request_id != self.request_id:
+            return  # Başka bir bileşenin isteği
+        self.request_id = None
+        if error is not None:
+            print(f"Hava durumu API hatası: {error}")
+        self.on_fetched(data)
+
+    def on_fetched(self, data):
+        if not self.first_fetch_done:
+            self.first_fetch_done = True
+            mark_startup("hava durumu")
+        if data is not None:
+            self.data, self.fetched_at = data, time.time()
+            self.weather_changed.emit(data)
+        elif self.expired():
+            # Ağ yok ve elimizdeki veri çok eski: bayat sıcaklık gösterilmez
+            self.weather_changed.emit(None)
+
 class WeatherWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(280, 70)
-        self.icons_dir = Path(__file__).parent / "icons"
-        self.weather_icons = {
-            "Sunny": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/sunny.png",
-            "Clear": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/sunny.png",
-            "Partly cloudy": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/partly_cloudy.png",
-            "Cloudy": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/cloudy.png",
-            "Overcast": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/cloudy.png",
-            "Mist": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/cloudy.png",
-            "Patchy rain possible": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/rainy.png",
-            "Light rain": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/rainy.png",
-            "Moderate rain": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/rainy.png",
-            "Heavy rain": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/rainy.png",
-            "Light snow": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/snowy.png",
-            "Moderate snow": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/snowy.png",
-            "Heavy snow": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/snowy.png",
-            "Thunderstorm": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/stormy.png",
-            "Thunder": "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/stormy.png"
-        }
+        # İkonlar kaynak paketinden bir kez çözülüp ölçeklenir; güncellemede disk ve ölçekleme yok
+        self.icon_pixmaps = weather_icons(60)
+        self.default_icon_pixmap = weather_icons(70).get(DEFAULT_WEATHER_ICON)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 10, 15, 10)
         layout.setSpacing(0)
@@ -802,7 +2472,7 @@ class WeatherWidget(QWidget):
         temp_day_layout = QVBoxLayout()
         temp_day_layout.setContentsMargins(10, 0, 0, 0)  # Sol tarafa boşluk ekleyerek ikona yaklaştırıyoruz
         
-        self.temp_label = QLabel("25°C")
+        self.temp_label = QLabel("--°C")  # İlk yanıt ya da önbellek gelene kadar
         self.temp_label.setStyleSheet("color: #333333; font-size: 20px; font-weight: bold;")
         temp_day_layout.addWidget(self.temp_label)
         
@@ -815,46 +2485,28 @@ class WeatherWidget(QWidget):
         layout.setStretch(1, 3)  # İkona daha fazla yer
         layout.setStretch(2, 2)  # Sıcaklık-gün kısmına daha az yer
         self.set_default_icon()
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_weather)
-        self.timer.start(300000)  # Her 5 dakikada bir güncelle
-        self.update_weather()
+        # Saat ağdan bağımsızdır: her dakika başında tek atımlık zamanlayıcıyla güncellenir
+        self.clock_timer = QTimer(self)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.PreciseTimer)
+        self.clock_timer.timeout.connect(self.tick_clock)
+        self.tick_clock()
+        self.provider = WeatherProvider()
+        self.provider.weather_changed.connect(self.apply_weather)
+        self.provider.start()
     
     def set_default_icon(self):
         """Varsayılan ikonu yükle"""
-        try:
-            icon_path = "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/partly_cloudy.png"
-            pixmap = QPixmap(icon_path)
-            if pixmap.isNull():
-                icon_path = str(self.icons_dir / "partly_cloudy.png")
-                pixmap = QPixmap(icon_path)
-                
-            if not pixmap.isNull():
-                self.weather_icon.setPixmap(pixmap.scaled(70, 70, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                print(f"Ikon yüklenemedi: {icon_path}")
-        except Exception as e:
-            print(f"İkon yükleme hatası: {e}")
+        if self.default_icon_pixmap is not None:
+            self.weather_icon.setPixmap(self.default_icon_pixmap)
     
-    def get_weather_data(self, city="Istanbul"):
-        try:
-            url = f"https://wttr.in/{city}?format=j1"
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception as e:
-            print(f"Hava durumu API hatası: {e}")
-            return None
-    
-    def get_icon_path(self, condition):
-        """Hava durumuna göre uygun ikon yolunu al"""
-        for key in self.weather_icons:
-            if key.lower() in condition.lower():
-                return f":/icons/icons/{self.weather_icons[key]}"
-        return "C:/Users/Oyun/Downloads/SAR/SAR FRONTEND/SAR GUI/icons/partly_cloudy.png"
-    
-    def update_weather(self):
+    def tick_clock(self):
+        """Saati günceller ve zamanlayıcıyı bir sonraki dakikanın başına kurar"""
+        self.update_clock()
+        # Sınırın hemen ardına düşmek için küçük bir pay bırakılır
+        self.clock_timer.start(int((60 - time.time() % 60) * 1000) + 20)
+
+    def update_clock(self):
         now = datetime.now()
         self.time_label.setText(now.strftime("%H:%M"))
         self.date_label.setText(now.strftime("%d/%m/%Y"))
@@ -871,38 +2523,25 @@ class WeatherWidget(QWidget):
         day_english = now.strftime("%A")
         day_turkish = turkish_days.get(day_english, day_english.upper())
         self.day_label.setText(day_turkish)
-        weather_data = self.get_weather_data()
-        
+
+    @Slot(object)
+    def apply_weather(self, weather_data):
         if weather_data:
             try:
-                temp = weather_data["current_condition"][0]["temp_C"]
-                condition = weather_data["current_condition"][0]["weatherDesc"][0]["value"]
+                current = weather_data["current_condition"][0]
+                temp = current["temp_C"]
                 self.temp_label.setText(f"{temp}°C")
-                try:
-                    icon_path = self.get_icon_path(condition)
-                    pixmap = QPixmap(icon_path)
-                    
-                    if pixmap.isNull():
-                        for key in self.weather_icons:
-                            if key.lower() in condition.lower():
-                                file_path = str(self.icons_dir / self.weather_icons[key])
-                                pixmap = QPixmap(file_path)
-                                if not pixmap.isNull():
-                                    break
-                    
-                    if not pixmap.isNull():
-                        self.weather_icon.setPixmap(pixmap.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                    else:
-                        self.set_default_icon()
-                        
-                except Exception as e:
-                    print(f"İkon yükleme hatası: {e}")
+                icon = weather_icon_name(current.get("weatherCode"), current["weatherDesc"][0]["value"])
+                pixmap = self.icon_pixmaps.get(icon)
+                if pixmap is not None:
+                    self.weather_icon.setPixmap(pixmap)
+                else:
                     self.set_default_icon()
-                    
             except Exception as e:
                 print(f"Hava durumu veri işleme hatası: {e}")
                 self.set_default_icon()
         else:
+            self.temp_label.setText("--°C")
             self.set_default_icon()
     
     def paintEvent(self, event):
@@ -930,9 +2569,7 @@ class SideMenu(QWidget):
             self.battery_label = QLabel(self.battery_info)
             self.battery_label.setStyleSheet("color: #555555; font-size: 16px; font-weight: bold; margin-left: 10px;")
             self.layout.addWidget(self.battery_label)
-            self.battery_timer = QTimer(self)
-            self.battery_timer.timeout.connect(self.update_battery_info)
-            self.battery_timer.start(60000)  # Her dakika güncelle
+            self.battery_task = frame_scheduler().add(self.update_battery_info, 60000)  # Her dakika güncelle
         self.create_menu_items()
         self.layout.addStretch()
     
@@ -1070,9 +2707,7 @@ class SideMenu(QWidget):
             self.battery_label = QLabel(self.battery_info)
             self.battery_label.setStyleSheet("color: #555555; font-size: 16px; font-weight: bold; margin-left: 10px;")
             self.layout.insertWidget(1, self.battery_label)
-            self.battery_timer = QTimer(self)
-            self.battery_timer.timeout.connect(self.update_battery_info)
-            self.battery_timer.start(60000)  # Her dakika güncelle
+            self.battery_task = frame_scheduler().add(self.update_battery_info, 60000)  # Her dakika güncelle
         self.create_menu_items()
     
     def paintEvent(self, event):
@@ -1130,6 +2765,54 @@ class BottomBar(QWidget):
         path.addRoundedRect(self.rect(), 30, 30)
         painter.fillPath(path, QColor(200, 200, 200, 180))
 
+class PageIndicator(QWidget):
+    pageRequested = Signal(int)  # İstenen sayfa indisini gönderir
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(160, 36)
+        self.page = 0
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(10, 2, 10, 2)
+        button_style = """
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                color: #AAAAAA;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                color: #FFFFFF;
+            }
+        """
+        self.prev_button = QPushButton("◀")
+        self.prev_button.setStyleSheet(button_style)
+        self.prev_button.clicked.connect(lambda: self.pageRequested.emit(self.page - 1))
+        layout.addWidget(self.prev_button)
+        self.page_label = QLabel()
+        self.page_label.setAlignment(Qt.AlignCenter)
+        self.page_label.setStyleSheet("color: #AAAAAA; font-size: 16px; font-weight: bold;")
+        layout.addWidget(self.page_label)
+        self.next_button = QPushButton("▶")
+        self.next_button.setStyleSheet(button_style)
+        self.next_button.clicked.connect(lambda: self.pageRequested.emit(self.page + 1))
+        layout.addWidget(self.next_button)
+
+    def set_pages(self, page, page_count):
+        self.page = page
+        self.page_label.setText(f"{page + 1}/{page_count}")
+        self.prev_button.setEnabled(page > 0)
+        self.next_button.setEnabled(page < page_count - 1)
+        self.setVisible(page_count > 1)  # Tek sayfa varsa gösterilmez
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(self.rect(), 18, 18)
+        painter.fillPath(path, QColor(0, 0, 0, 160))
+
 class CloseButton(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1235,41 +2918,337 @@ class CloseButton(QWidget):
     
  
 
+DISCONNECTED_READING = {"status": "disconnected", "signal": 0}
+
+def parse_sensor_message(line):
+    """Bir satırı (anahtar ya da None, okuma) olarak çözer; anlaşılmazsa None döndürür"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except ValueError:
+        # Düz metin: "connected 3" ya da "disconnected"
+        parts = line.split()
+        message = {"status": parts[0], "signal": parts[1] if len(parts) > 1 else 0}
+    if not isinstance(message, dict) or "status" not in message:
+        return None
+    try:
+        signal = max(0, min(3, int(message.get("signal", 0))))
+    except (TypeError, ValueError):
+        return None
+    status = "connected" if str(message["status"]).lower() == "connected" else "disconnected"
+    return message.get("key"), {"status": status, "signal": signal if status == "connected" else 0}
+
+class SensorSource(abc.ABC):
+    """Tek bir sensörün veri kaynağı; toplayıcı dosya tanıtıcısı okunabilir olduğunda read() çağırır"""
+    uses_fileobj = True  # False ise kaynak yalnızca zamanla (poll) çalışır
+
+    def __init__(self, key):
+        self.key = key
+        self.fileobj = None
+        self.connecting = False  # Engellemeyen TCP bağlantısı kurulurken yazılabilirlik beklenir
+        self.buffer = bytearray()
+        self.last_seen = None
+        self.retry_at = 0.0
+        self.retry_delay = 1.0
+
+    @abc.abstractmethod
+    def open(self):
+        """Kaynağı açar ve fileobj'u ayarlar; açılamazsa OSError fırlatır"""
+
+    @abc.abstractmethod
+    def read(self):
+        """Okunabilir tanıtıcıdan gelen (anahtar, okuma) çiftlerini döndürür; kopmada OSError fırlatır"""
+
+    def finish_connect(self):
+        self.connecting = False
+
+    def poll(self, now):
+        return []
+
+    def next_deadline(self):
+        return None
+
+    def lines(self, data):
+        """Gelen baytları tampona ekler, tamamlanan satırları çözer"""
+        self.buffer.extend(data)
+        readings = []
+        while True:
+            end = self.buffer.find(b"\n")
+            if end == -1:
+                break
+            line = self.buffer[:end].decode("utf-8", "replace")
+            del self.buffer[:end + 1]
+            parsed = parse_sensor_message(line)
+            if parsed is not None:
+                key, reading = parsed
+                readings.append((key or self.key, reading))
+        return readings
+
+    def close(self):
+        if self.fileobj is not None:
+            self.fileobj.close()
+        self.fileobj = None
+        self.connecting = False
+        self.buffer.clear()
+
+class UdpSensorSource(SensorSource):
+    """Cihazın gönderdiği UDP datagramlarını dinler; her datagram bir ya da birkaç satırdır"""
+    def __init__(self, key, port, host="0.0.0.0"):
+        super().__init__(key)
+        self.address = (host, port)
+
+    def open(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            sock.bind(self.address)
+        except OSError:
+            sock.close()
+            raise
+        self.fileobj = sock
+
+    def read(self):
+        readings = []
+        while True:
+            try:
+                data, _ = self.fileobj.recvfrom(65535)
+            except BlockingIOError:
+                return readings
+            readings.extend(self.lines(data + b"\n"))
+
+class TcpLineSensorSource(SensorSource):
+    """Cihaza TCP ile bağlanır ve satır satır gelen okumaları işler"""
+    def __init__(self, key, host, port):
+        super().__init__(key)
+        self.address = (host, port)
+
+    def open(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            sock.connect(self.address)
+        except BlockingIOError:
+            # Linux'ta EINPROGRESS, Windows'ta WSAEWOULDBLOCK; bağlantı arka planda sürer
+            self.connecting = True
+        except OSError:
+            # Ad çözülemedi, ağ erişilemez...: tanıtıcı kaynakta bırakılmaz
+            sock.close()
+            raise
+        self.fileobj = sock
+
+    def finish_connect(self):
+        error = self.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if error:
+            raise OSError(error, os.strerror(error))
+        self.connecting = False
+
+    def read(self):
+        try:
+            data = self.fileobj.recv(4096)
+        except BlockingIOError:
+            return []
+        if not data:
+            raise ConnectionError("bağlantı karşı taraftan kapatıldı")
+        return self.lines(data)
+
+class SerialFile:
+    """Ham dosya tanıtıcısını seçicinin beklediği fileno()/close() arayüzüyle sarar"""
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+    def close(self):
+        os.close(self.fd)
+
+class SerialSensorSource(SensorSource):
+    """Seri porttan (ya da pty'den) satır okur; yalnızca POSIX sistemlerde çalışır"""
+    def __init__(self, key, path, baudrate=115200):
+        super().__init__(key)
+        self.path = path
+        self.baudrate = baudrate
+
+    def open(self):
+        if termios is None:
+            raise OSError("seri port kaynağı bu platformda desteklenmiyor")
+        fd = os.open(self.path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            if os.isatty(fd):
+                tty.setraw(fd)
+                attributes = termios.tcgetattr(fd)
+                speed = getattr(termios, f"B{self.baudrate}")
+                attributes[4] = attributes[5] = speed
+                termios.tcsetattr(fd, termios.TCSANOW, attributes)
+        except (OSError, termios.error, AttributeError) as e:
+            os.close(fd)
+            raise OSError(f"seri port ayarlanamadı: {e}") from e
+        self.fileobj = SerialFile(fd)
+
+    def read(self):
+        try:
+            data = os.read(self.fileobj.fd, 4096)
+        except BlockingIOError:
+            return []
+        if not data:
+            raise ConnectionError("seri port kapandı")
+        return self.lines(data)
+
+class SimulatedSensorSource(SensorSource):
+    """Donanım yokken ve testlerde kullanılan rastgele durum değiştiren kaynak"""
+    uses_fileobj = False
+
+    def __init__(self, key, interval=2.0):
+        super().__init__(key)
+        self.interval = interval
+        self.reading = dict(DISCONNECTED_READING)
+        self.due = time.monotonic()
+
+    def open(self):
+        """Açılacak tanıtıcı yok; okumalar poll() ile üretilir"""
+
+    def read(self):
+        return []
+
+    def poll(self, now):
+        if now < self.due:
+            return []
+        self.due = now + self.interval
+        if random.random() < 0.1:  # 10% chance to change status GUI made by E.R.D.3.M
+            if self.reading["status"] == "connected":
+                self.reading = dict(DISCONNECTED_READING)
+            else:
+                self.reading = {"status": "connected", "signal": random.randint(1, 3)}
+        return [(self.key, self.reading)]
+
+    def next_deadline(self):
+        return self.due
+
+SENSOR_SOURCE_TYPES = {
+    "simulated": SimulatedSensorSource,
+    "udp": UdpSensorSource,
+    "tcp": TcpLineSensorSource,
+    "serial": SerialSensorSource,
+}
+
+def create_sensor_source(spec):
+    params = {name: value for name, value in spec.items() if name not in ("key", "type")}
+    return SENSOR_SOURCE_TYPES[spec["type"]](spec["key"], **params)
+
 class SensorDataCollector(QObject):
+    """Sensör kaynaklarını tek iş parçacığında seçici (select) ile bekler; yalnızca değişen sensörleri yayınlar"""
     data_changed = Signal(dict)
     
-    def __init__(self):
+    def __init__(self, sources=None, stale_after=CONFIG["sensor_stale_after_s"]):
         super().__init__()
+        if sources is None:
+            sources = [create_sensor_source(spec) for spec in CONFIG["sensor_sources"]]
+        self.sources = sources
+        self.stale_after = stale_after
         self.running = True
-        self.data = {
-            "camera": {"status": "disconnected", "signal": 0},
-            "heat_sensor": {"status": "disconnected", "signal": 0},
-            "ai_system": {"status": "disconnected", "signal": 0},
-            "sonar": {"status": "disconnected", "signal": 0},
-            "surveillance": {"status": "disconnected", "signal": 0},
-            "tag_scanner": {"status": "disconnected", "signal": 0},
-        }
+        self.data = {source.key: dict(DISCONNECTED_READING) for source in self.sources}
+        self.selector = selectors.DefaultSelector()
+        # stop() bu çift üzerinden bekleyen select çağrısını uyandırır
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+        self.selector.register(self.wakeup_reader, selectors.EVENT_READ, None)
         self.thread = threading.Thread(target=self.collect_data)
         self.thread.daemon = True
         self.thread.start()
-    
+
+    def apply(self, key, reading, changes):
+        if self.data.get(key) != reading:
+            self.data[key] = reading
+            changes[key] = reading
+
+    def open_source(self, source, now):
+        try:
+            source.open()
+        except OSError as e:
+            print(f"Sensör kaynağı açılamadı [{source.key}]: {e}")
+            self.close_source(source, now)
+            return
+        events = selectors.EVENT_WRITE if source.connecting else selectors.EVENT_READ
+        self.selector.register(source.fileobj, events, source)
+
+    def close_source(self, source, now):
+        """Kaynağı kapatır ve artan bekleme süresiyle yeniden açmayı planlar"""
+        if source.fileobj is not None:
+            try:
+                self.selector.unregister(source.fileobj)
+            except KeyError:
+                pass  # open() kaydedilmeden önce hata verdi
+            source.close()
+        source.retry_at = now + source.retry_delay
+        source.retry_delay = min(30.0, source.retry_delay * 2)
+
+    def next_timeout(self, now):
+        deadlines = []
+        for source in self.sources:
+            if not source.uses_fileobj:
+                deadlines.append(source.next_deadline())
+            elif source.fileobj is None:
+                deadlines.append(source.retry_at)
+            elif source.last_seen is not None and self.data[source.key]["status"] == "connected":
+                deadlines.append(source.last_seen + self.stale_after)
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        if not deadlines:
+            return None  # Yalnızca okunabilirlik ya da stop() uyandırır
+        return max(0.0, min(deadlines) - now)
+
     def collect_data(self):
         while self.running:
-            for sensor in self.data:
-                if random.random() < 0.1:  # 10% chance to change status GUI made by E.R.D.3.M
-                    if self.data[sensor]["status"] == "connected":
-                        self.data[sensor]["status"] = "disconnected"
-                        self.data[sensor]["signal"] = 0
-                    else:
-                        self.data[sensor]["status"] = "connected"
-                        self.data[sensor]["signal"] = random.randint(1, 3)
-            self.data_changed.emit(self.data.copy())
-            time.sleep(2)
+            changes = {}
+            now = time.monotonic()
+            for source in self.sources:
+                if not source.uses_fileobj:
+                    for key, reading in source.poll(now):
+                        self.apply(key, reading, changes)
+                elif source.fileobj is None:
+                    if now >= source.retry_at:
+                        self.open_source(source, now)
+                elif source.last_seen is not None and now - source.last_seen >= self.stale_after:
+                    # Cihaz sustu: bağlantı açık olsa da sinyal yok sayılır
+                    self.apply(source.key, dict(DISCONNECTED_READING), changes)
+
+            for key, _ in self.selector.select(self.next_timeout(now)):
+                source = key.data
+                if source is None:
+                    self.wakeup_reader.recv(64)
+                    continue
+                now = time.monotonic()
+                try:
+                    if source.connecting:
+                        source.finish_connect()
+                        self.selector.modify(source.fileobj, selectors.EVENT_READ, source)
+                        continue
+                    readings = source.read()
+                except OSError as e:
+                    print(f"Sensör kaynağı koptu [{source.key}]: {e}")
+                    self.close_source(source, now)
+                    self.apply(source.key, dict(DISCONNECTED_READING), changes)
+                    continue
+                if readings:
+                    source.last_seen = now
+                    source.retry_delay = 1.0
+                for reading_key, reading in readings:
+                    self.apply(reading_key, reading, changes)
+
+            if changes:
+                self.data_changed.emit(changes)
     
     def stop(self):
         self.running = False
+        self.wakeup_writer.send(b"\0")
         if self.thread.is_alive():
             self.thread.join(1)
+        for source in self.sources:
+            source.close()
+        self.selector.close()
+        self.wakeup_reader.close()
+        self.wakeup_writer.close()
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -1302,23 +3281,36 @@ class MainWindow(QMainWindow):
         self.close_button = CloseButton()
         self.close_button.setParent(self.central_widget)
         self.sensor_grid = QWidget(self.content_container)
-        grid_layout = QGridLayout(self.sensor_grid)
-        grid_layout.setContentsMargins(15, 15, 15, 15)
-        grid_layout.setSpacing(45)
-        self.tiles = {
-            "camera": WebcamWidget(),  # Kamera widget'ı
-            "heat_sensor": ESP32CamTile("HEAT SENSOR", "http://<ESP32-CAM-IP>/capture"),  # ESP32-CAM URL'sini buraya yazın
+        self.grid_layout = QGridLayout(self.sensor_grid)
+        self.grid_layout.setContentsMargins(15, 15, 15, 15)
+        self.grid_layout.setSpacing(TILE_SPACING)
+        self.grid_columns = CONFIG["grid_columns"]
+        self.grid_rows = CONFIG["grid_rows"]
+        self.tiles = {"camera": WebcamWidget()}  # Kamera widget'ı sol üstte
+        # ESP32-CAM'ler ayarlardaki listeden gelir (URL'leri sar_config.json'a yazın)
+        self.camera_fleet = CameraFleet.from_config(CONFIG, TILE_SIZE)
+        self.esp32_tiles = []
+        for i, camera in enumerate(CONFIG["esp32_cameras"]):
+            tile = ESP32CamTile(camera["title"], camera["url"])
+            self.tiles[camera.get("key", f"esp32_{i}")] = tile
+            self.esp32_tiles.append(tile)
+        self.tiles.update({
             "ai_system": SensorTile("AI SYSTEM OUTPUT"),
             "sonar": SensorTile("SONAR SENSORS"),
             "surveillance": SensorTile("SURVEILLANCE CAM"),
             "tag_scanner": SensorTile("TAG SCANNER"),
-        }
-        grid_layout.addWidget(self.tiles["camera"], 0, 0)  # ESP32-CAM widget'ı sol üstte
-        grid_layout.addWidget(self.tiles["heat_sensor"], 0, 1)
-        grid_layout.addWidget(self.tiles["ai_system"], 0, 2)
-        grid_layout.addWidget(self.tiles["sonar"], 1, 0)
-        grid_layout.addWidget(self.tiles["surveillance"], 1, 1)
-        grid_layout.addWidget(self.tiles["tag_scanner"], 1, 2)
+        })
+        self.camera_fleet.frame_ready.connect(lambda i, image: self.esp32_tiles[i].on_frame_ready(image))
+        self.camera_fleet.state_changed.connect(lambda i, state: self.esp32_tiles[i].on_connection_state(state))
+        # Karolar ızgaraya sığmazsa sayfalara bölünür
+        self.current_page = 0
+        self.window_active = True
+        self.exposure_watched = False
+        self.page_indicator = PageIndicator()
+        self.page_indicator.setParent(self.central_widget)
+        self.page_indicator.pageRequested.connect(self.show_page)
+        self.show_page(0)
+        self.camera_fleet.start()
         self.data_collector = SensorDataCollector()
         self.data_collector.data_changed.connect(self.update_sensor_data)
         self.menu_open = False
@@ -1326,6 +3318,35 @@ class MainWindow(QMainWindow):
         self.current_menu_button = None  # Track which button is currently active
         self.resizeEvent(None)
     
+    @property
+    def page_count(self):
+        page_size = self.grid_columns * self.grid_rows
+        return max(1, math.ceil(len(self.tiles) / page_size))
+
+    def show_page(self, page):
+        """Izgarada yalnızca istenen sayfadaki karoları gösterir"""
+        self.current_page = max(0, min(page, self.page_count - 1))
+        page_size = self.grid_columns * self.grid_rows
+        first = self.current_page * page_size
+        for i, tile in enumerate(self.tiles.values()):
+            self.grid_layout.removeWidget(tile)
+            if first <= i < first + page_size:
+                position = i - first
+                self.grid_layout.addWidget(tile, position // self.grid_columns, position % self.grid_columns)
+                tile.show()
+            else:
+                tile.hide()
+        self.apply_tile_activity()
+        self.page_indicator.set_pages(self.current_page, self.page_count)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_PageDown:
+            self.show_page(self.current_page + 1)
+        elif event.key() == Qt.Key_PageUp:
+            self.show_page(self.current_page - 1)
+        else:
+            super().keyPressEvent(event)
+
     def handle_button_click(self, button_index):
         button_titles = [
             "AYARLAR", "BAĞLANTILAR", "KONTROLLER", "SES AYARLARI", 
@@ -1394,8 +3415,8 @@ class MainWindow(QMainWindow):
         self.side_menu.setFixedHeight(self.height())
         self.content_container.setFixedSize(self.width(), self.height())
         self.content_container.move(0, 0)  # Always at position 0,0
-        grid_width = 3 * 450 + 2 * 45    # 3 columns * tile width + spacing
-        grid_height = 2 * 315 + 45       # 2 rows * tile height + spacing
+        grid_width = self.grid_columns * TILE_SIZE.width() + (self.grid_columns - 1) * TILE_SPACING    # columns * tile width + spacing
+        grid_height = self.grid_rows * TILE_SIZE.height() + (self.grid_rows - 1) * TILE_SPACING       # rows * tile height + spacing
         self.sensor_grid.setFixedSize(grid_width, grid_height)
         self.sensor_grid.move(
             (self.width() - grid_width) // 2,
@@ -1406,17 +3427,73 @@ class MainWindow(QMainWindow):
             (self.width() - self.bottom_bar.width()) // 2,
             self.height() - self.bottom_bar.height() - 10
         )
+        self.page_indicator.move(
+            (self.width() - self.page_indicator.width()) // 2,
+            self.bottom_bar.y() - self.page_indicator.height() - 10
+        )
         self.close_button.move(
             self.width() - 250,
             self.height() - 200
         )
     
+    def apply_tile_activity(self):
+        """Yalnızca ekrandaki karolar çıkarım ve sık yoklama yapar"""
+        camera = self.tiles["camera"]
+        camera.set_active(self.window_active and not camera.isHidden())
+        self.camera_fleet.set_visible(
+            i for i, tile in enumerate(self.esp32_tiles)
+            if self.window_active and not tile.isHidden()
+        )
+
+    def update_activity(self):
+        """Pencere simge durumunda, gizli ya da tamamen örtülüyse çizimi ve yoklamayı askıya alır"""
+        handle = self.windowHandle()
+        active = (self.isVisible()
+                  and not self.windowState() & Qt.WindowMinimized
+                  and (handle is None or handle.isExposed()))
+        if active == self.window_active:
+            return
+        self.window_active = active
+        frame_scheduler().set_suspended(not active)
+        self.apply_tile_activity()
+        print("Pencere etkin, çizim sürdürülüyor" if active else "Pencere görünmüyor, çizim askıya alındı")
+
+    def eventFilter(self, obj, event):
+        # Örtülme bilgisi QWidget'a değil, alttaki QWindow'a expose olayı olarak gelir
+        if obj is self.windowHandle() and event.type() == QEvent.Expose:
+            self.update_activity()
+        return super().eventFilter(obj, event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self.update_activity()
+        super().changeEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_activity()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.exposure_watched and self.windowHandle() is not None:
+            self.windowHandle().installEventFilter(self)
+            self.exposure_watched = True
+        self.update_activity()
+
     def closeEvent(self, event):
+        self.particle_bg.particle_renderer.stop()
         self.data_collector.stop()
+        self.tiles["camera"].stop()
+        self.camera_fleet.stop()
+        http_service().stop()
         super().closeEvent(event)
 
+if PROVISION_MODE:
+    sys.exit(0 if provision() else 1)
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    # QApplication açılış penceresiyle birlikte yukarıda oluşturuldu
     window = MainWindow()
+    mark_startup("ana pencere")
     window.showFullScreen()  # Use full screen for best effect
     sys.exit(app.exec())
@@ -3,24 +3,66 @@ import sys
 import subprocess
 import importlib.util
 import threading
-import tkinter as tk
+import os
+import json
+import site
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+
+REQUIRED_PACKAGES = ['PySide6', 'requests']
+REQUIREMENTS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sar_requirements_cache.json")
+
+def environment_fingerprint(required):
+    """Yorumlayıcı yolu ve site-packages dizinlerinin değişiklik zamanlarından ortam parmak izi üretir"""
+    paths = set(site.getsitepackages()) | {site.getusersitepackages()}
+    paths |= {sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"]}
+    mtimes = [[path, os.stat(path).st_mtime_ns] for path in sorted(paths) if os.path.isdir(path)]
+    return {"executable": sys.executable, "version": sys.version,
+            "site_packages": mtimes, "required": list(required)}
+
+def requirements_cached(required):
+    try:
+        with open(REQUIREMENTS_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f) == environment_fingerprint(required)
+    except (OSError, ValueError):
+        return False
 
-root = tk.Tk()
-root.title("Yükleniyor...")
-root.geometry("300x100")
-root.resizable(False, False)
-label = tk.Label(root, text="Ön gereksinimler denetleniyor...\nLütfen bekleyin.", font=("Arial", 10))
-label.pack(expand=True)
+def save_requirements_cache(required):
+    try:
+        with open(REQUIREMENTS_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(environment_fingerprint(required), f)
+    except OSError as e:
+        print(f"Gereksinim önbelleği yazılamadı: {e}")
 
-def check_and_continue():
-    required = ['PySide6', 'requests']
-    for pkg in required:
-        if importlib.util.find_spec(pkg) is None:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', pkg])
+def probe_requirements(required):
+    """Tüm paketleri paralel denetler, eksik olanları döndürür"""
+    with ThreadPoolExecutor(max_workers=len(required)) as pool:
+        found = list(pool.map(importlib.util.find_spec, required))
+    return [pkg for pkg, spec in zip(required, found) if spec is None]
+
+def check_and_continue(missing):
+    # Tek pip çağrısı: bağımlılıklar bir kez çözülür
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install', *missing])
+    save_requirements_cache(REQUIRED_PACKAGES)
     root.destroy()
 
-threading.Thread(target=check_and_continue, daemon=True).start()
-root.mainloop()
+# Yükleme penceresi yalnızca gerçekten eksik paket varsa açılır
+if not requirements_cached(REQUIRED_PACKAGES):
+    missing = probe_requirements(REQUIRED_PACKAGES)
+    if missing:
+        import tkinter as tk
+
+        root = tk.Tk()
+        root.title("Yükleniyor...")
+        root.geometry("300x100")
+        root.resizable(False, False)
+        label = tk.Label(root, text="Ön gereksinimler denetleniyor...\nLütfen bekleyin.", font=("Arial", 10))
+        label.pack(expand=True)
+
+        threading.Thread(target=check_and_continue, args=(missing,), daemon=True).start()
+        root.mainloop()
+    else:
+        save_requirements_cache(REQUIRED_PACKAGES)
 
 import sys
 import random
@@ -36,7 +78,7 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel,
                               QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton,
                               QGraphicsBlurEffect)
 from PySide6.QtCore import (Qt, QTimer, QPropertyAnimation, QRect, QSize, 
-                           QEasingCurve, QPoint, Slot, QThread, Signal, QObject)
+                           QEasingCurve, QPoint, Slot, QThread, Signal, QObject, QEvent)
 from PySide6.QtGui import (QColor, QPainter, QPen, QBrush, QFont, 
                           QFontMetrics, QGradient, QLinearGradient, QRadialGradient, 
                           QPainterPath, QPixmap, QIcon)
@@ -1028,6 +1070,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("S.A.R System")
         self.setMinimumSize(1200, 800)
+        self.paused_timers = None  # Pencere görünmezken durdurulan zamanlayıcılar
+        self.exposure_watched = False
         
         # Central widget with transparent background
         self.central_widget = QWidget()
@@ -1220,6 +1264,45 @@ class MainWindow(QMainWindow):
             self.height() - 200
         )
     
+    def update_activity(self):
+        """Pencere simge durumunda, gizli ya da tamamen örtülüyse tüm animasyon ve yoklama zamanlayıcılarını durdurur"""
+        handle = self.windowHandle()
+        active = (self.isVisible()
+                  and not self.windowState() & Qt.WindowMinimized
+                  and (handle is None or handle.isExposed()))
+        if active == (self.paused_timers is None):
+            return
+        if active:
+            for timer in self.paused_timers:
+                timer.start()
+            self.paused_timers = None
+        else:
+            self.paused_timers = [timer for timer in self.findChildren(QTimer) if timer.isActive()]
+            for timer in self.paused_timers:
+                timer.stop()
+
+    def eventFilter(self, obj, event):
+        # Örtülme bilgisi QWidget'a değil, alttaki QWindow'a expose olayı olarak gelir
+        if obj is self.windowHandle() and event.type() == QEvent.Expose:
+            self.update_activity()
+        return super().eventFilter(obj, event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self.update_activity()
+        super().changeEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_activity()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.exposure_watched and self.windowHandle() is not None:
+            self.windowHandle().installEventFilter(self)
+            self.exposure_watched = True
+        self.update_activity()
+
     def closeEvent(self, event):
         # Stop the data collector thread when closing the app
         self.data_collector.stop()
@@ -0,0 +1,93 @@
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import FINALRPOJECT as app
+except ImportError:  # PySide6, numpy ya da requests kurulu değil
+    app = None
+
+BOUNDARY = b"123456789000000000000987654321"
+FRAMES = [b"\xff\xd8first frame\xff\xd9", b"\xff\xd8second\r\n\r\nframe\xff\xd9", b"\xff\xd8third\xff\xd9"]
+
+def multipart(frames, content_length=True):
+    """ESP32-CAM /stream yanıtındaki gibi multipart/x-mixed-replace gövdesi üretir"""
+    body = b""
+    for frame in frames:
+        body += b"--" + BOUNDARY + b"\r\nContent-Type: image/jpeg\r\n"
+        if content_length:
+            body += b"Content-Length: %d\r\n" % len(frame)
+        body += b"\r\n" + frame + b"\r\n"
+    return body
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class StreamHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/x-mixed-replace;boundary=" + BOUNDARY.decode())
+        self.end_headers()
+        for chunk in split(multipart(FRAMES), 5):
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+@unittest.skipIf(app is None, "uygulama bağımlılıkları kurulu değil")
+class ExtractStreamFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.Esp32CamClient("http://127.0.0.1:1/stream")
+
+    def feed(self, chunks):
+        """Parçaları tek tek tampona ekler ve her adımda tamamlanan kareleri toplar"""
+        frames = []
+        for chunk in chunks:
+            self.client.stream_buffer.extend(chunk)
+            while True:
+                jpeg = self.client.extract_stream_frame()
+                if jpeg is None:
+                    break
+                frames.append(jpeg)
+        return frames
+
+    def test_frames_split_across_chunks(self):
+        for size in (1, 3, 7, 4096):
+            self.client.stream_buffer.clear()
+            self.assertEqual(self.feed(split(multipart(FRAMES), size)), FRAMES)
+
+    def test_partial_frame_waits_for_more_data(self):
+        data = multipart(FRAMES[:1])
+        self.assertEqual(self.feed([data[:-5]]), [])
+        self.assertEqual(self.feed([data[-5:]]), FRAMES[:1])
+
+    def test_missing_content_length_uses_jpeg_markers(self):
+        frames = [FRAMES[0], FRAMES[2]]
+        self.assertEqual(self.feed(split(multipart(frames, content_length=False), 4)), frames)
+
+@unittest.skipIf(app is None, "uygulama bağımlılıkları kurulu değil")
+class LocalStreamServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StreamHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = app.Esp32CamClient(f"http://127.0.0.1:{self.server.server_port}/stream")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reads_frames_until_stream_closes(self):
+        self.assertTrue(self.client.stream_mode)
+        self.assertEqual([self.client.next_frame() for _ in FRAMES], FRAMES)
+        with self.assertRaises(Exception):
+            self.client.next_frame()
+
+if __name__ == "__main__":
+    unittest.main()
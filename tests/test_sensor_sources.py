@@ -0,0 +1,96 @@
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import FINALRPOJECT as app
+except ImportError:  # PySide6, numpy ya da requests kurulu değil
+    app = None
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+@unittest.skipIf(app is None, "uygulama bağımlılıkları kurulu değil")
+class ParseSensorMessageTest(unittest.TestCase):
+    def test_json_message(self):
+        self.assertEqual(app.parse_sensor_message('{"status": "connected", "signal": 2}'),
+                         (None, {"status": "connected", "signal": 2}))
+
+    def test_json_message_with_key(self):
+        self.assertEqual(app.parse_sensor_message('{"key": "sonar", "status": "CONNECTED", "signal": 9}'),
+                         ("sonar", {"status": "connected", "signal": 3}))
+
+    def test_plain_text(self):
+        self.assertEqual(app.parse_sensor_message(" connected 1\r"), (None, {"status": "connected", "signal": 1}))
+        self.assertEqual(app.parse_sensor_message("disconnected"), (None, app.DISCONNECTED_READING))
+
+    def test_disconnected_drops_signal(self):
+        self.assertEqual(app.parse_sensor_message("offline 3"), (None, app.DISCONNECTED_READING))
+
+    def test_invalid_lines(self):
+        for line in ("", "   ", "[1, 2]", '{"signal": 2}', "connected many"):
+            self.assertIsNone(app.parse_sensor_message(line), line)
+
+class LineServer:
+    """Her bağlantıda sıradaki satırı gönderip bağlantıyı kapatan yerel TCP sunucusu"""
+    def __init__(self, lines):
+        self.lines = list(lines)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        self.connections = 0
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        for line in self.lines:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            with conn:
+                conn.sendall(line)
+                time.sleep(0.2)  # Toplayıcı satırı işlesin, sonra bağlantı kopar
+
+    def close(self):
+        self.sock.close()
+
+@unittest.skipIf(app is None, "uygulama bağımlılıkları kurulu değil")
+class SensorCollectorTest(unittest.TestCase):
+    def tearDown(self):
+        self.collector.stop()
+
+    def test_tcp_source_reconnects_after_disconnect(self):
+        server = LineServer([b"connected 3\n", b'{"status": "connected", "signal": 1}\n'])
+        self.addCleanup(server.close)
+        source = app.TcpLineSensorSource("sonar", "127.0.0.1", server.port)
+        self.collector = app.SensorDataCollector([source], stale_after=30)
+        self.assertTrue(wait_for(lambda: self.collector.data["sonar"]["signal"] == 3))
+        self.assertTrue(wait_for(lambda: self.collector.data["sonar"]["status"] == "disconnected"))
+        # Kopmadan sonra geri çekilme süresi (1 s) dolunca yeniden bağlanılır
+        self.assertTrue(wait_for(lambda: self.collector.data["sonar"] == {"status": "connected", "signal": 1}))
+        self.assertEqual(server.connections, 2)
+
+    def test_failed_open_keeps_collector_running(self):
+        source = app.TcpLineSensorSource("sonar", "no-such-host.invalid", 9)
+        self.collector = app.SensorDataCollector([source])
+        self.assertTrue(wait_for(lambda: source.retry_at > 0))
+        time.sleep(0.2)
+        self.assertTrue(self.collector.thread.is_alive())
+        self.assertIsNone(source.fileobj)
+        self.assertEqual(self.collector.data["sonar"], app.DISCONNECTED_READING)
+
+if __name__ == "__main__":
+    unittest.main()